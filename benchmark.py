@@ -0,0 +1,773 @@
+"""Benchmarks for the launcher's hot paths.
+
+    python benchmark.py                          print results as JSON
+    python benchmark.py --save baseline.json     store results as a baseline
+    python benchmark.py --compare baseline.json  fail if anything regressed
+
+Importing launcher.py must also stay within IMPORT_BUDGET_MS, measured with
+python -X importtime in a fresh interpreter; going over fails the run.
+
+The Tk benchmarks need a display. On Linux, run them under a virtual X
+server: xvfb-run python benchmark.py
+"""
+import argparse
+import http.server
+import io
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import types
+
+import psutil
+from PIL import Image
+
+import launcher
+
+ENTRY_COUNTS = (20, 200, 2000)
+CONFIG_SIZES = (10, 100, 1000)
+FAVICON_SITES = 30
+FAVICON_LATENCY = 0.05
+FAVICON_TIMEOUT = 0.2
+UPDATE_TIMEOUT = 0.2
+PE_FILES = 64
+WATCHER_POLLS = 20
+SAMPLER_PROCS = 20
+SAMPLER_TICKS = 20
+TRIGGER_RULES = (1, 100, 1000)
+AUTO_LAUNCH_APPS = 200
+SEARCH_ENTRIES = 4000
+SEARCH_QUERIES = ("e", "ed", "elite", "inara", "edd", "eldis", "mktcon", "zzz")
+SEARCH_BUDGET_MS = 1.0
+SEARCH_WORDS = ("elite", "dangerous", "discovery", "market", "connector", "odyssey", "horizons", "engineer",
+                "trade", "route", "planner", "inara", "spansh", "coriolis", "journal", "monitor", "voice",
+                "attack", "overlay", "exploration", "mining", "carrier", "colonia", "galaxy", "map")
+AUTO_LAUNCH_SPAWN = 0.05
+TRIGGER_EVENTS = 10000
+DEFAULT_THRESHOLD = 0.25
+IMPORT_BUDGET_MS = 40
+IMPORT_RUNS = 5
+
+
+def import_time_ms():
+    # Cumulative time of the "launcher" line in -X importtime's report. The
+    # bytecode is compiled up front, because PYTHONDONTWRITEBYTECODE would
+    # otherwise make every run compile from source. The first run only warms
+    # the file cache, so later runs count.
+    import py_compile
+    py_compile.compile(launcher.__file__, doraise=True)
+    directory = os.path.dirname(os.path.abspath(launcher.__file__))
+    samples = []
+    for _ in range(IMPORT_RUNS + 1):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import launcher"],
+                              cwd=directory, capture_output=True, text=True, check=True)
+        for line in proc.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == "launcher":
+                samples.append(int(fields[1]) / 1000)
+    return min(samples[1:])
+
+
+def timed(func, repeat=1):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+# Stands in for Tk's after() where no display is needed.
+class ManualScheduler:
+    def __init__(self):
+        self.calls = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.calls[self.next_id] = func
+        return self.next_id
+
+    def after_cancel(self, call_id):
+        self.calls.pop(call_id, None)
+
+    def run_pending(self):
+        for call_id in list(self.calls):
+            self.calls.pop(call_id)()
+
+
+def sample_config(entries):
+    return {
+        "window_position": {"x": 100, "y": 100, "width": 500, "height": 400},
+        "grid_columns": 5,
+        "slogans": [f"Slogan number {i}" for i in range(100)],
+        "apps": [{"path": f"C:/Tools/Tool{i}/tool{i}.exe", "launch_with_ed": i % 3 == 0} for i in range(entries)],
+        "websites": [{"url": f"https://site{i}.example.com/page"} for i in range(entries)],
+    }
+
+
+def build_pe(path, sizes=(16, 32, 48, 256), dib=False, pe64=False):
+    # A minimal PE32 (or PE32+) file whose only section holds RT_ICON and
+    # RT_GROUP_ICON. Each image is a flat colour whose red channel is its
+    # size, with alpha, stored as PNG or as a 32-bit DIB with an AND mask.
+    images = []
+    for size in sizes:
+        if dib:
+            mask_row = (size + 31) // 32 * 4
+            pixels = bytes([200, 120, size % 256, 180]) * size * size
+            images.append(struct.pack("<IiiHHIIiiII", 40, size, size * 2, 1, 32, 0, len(pixels), 0, 0, 0, 0)
+                          + pixels + bytes(mask_row * size))
+            continue
+        buffer = io.BytesIO()
+        Image.new("RGBA", (size, size), (size % 256, 120, 200, 180)).save(buffer, "PNG")
+        images.append(buffer.getvalue())
+
+    def directory(entries):
+        return struct.pack("<IIHHHH", 0, 0, 0, 0, 0, len(entries)) + b"".join(struct.pack("<II", *e) for e in entries)
+
+    count = len(images)
+    section_rva = 0x1000
+    offset = 16 + 16
+    icon_dir = offset
+    offset += 16 + 8 * count
+    group_dir = offset
+    offset += 16 + 8
+    language_dirs = [offset + i * 24 for i in range(count + 1)]
+    offset += 24 * (count + 1)
+    data_entries = [offset + i * 16 for i in range(count + 1)]
+    offset += 16 * (count + 1)
+    group = struct.pack("<HHH", 0, 1, count) + b"".join(
+        struct.pack("<BBBBHHIH", size % 256, size % 256, 0, 0, 1, 32, len(image), i + 1)
+        for i, (size, image) in enumerate(zip(sizes, images)))
+    blobs = images + [group]
+    blob_offsets = []
+    for blob in blobs:
+        blob_offsets.append(offset)
+        offset = (offset + len(blob) + 7) & ~7
+
+    rsrc = bytearray(offset)
+    rsrc[0:32] = directory([(launcher.RT_ICON, 0x80000000 | icon_dir), (launcher.RT_GROUP_ICON, 0x80000000 | group_dir)])
+    rsrc[icon_dir:group_dir] = directory([(i + 1, 0x80000000 | language_dirs[i]) for i in range(count)])
+    rsrc[group_dir:group_dir + 24] = directory([(1, 0x80000000 | language_dirs[count])])
+    for i, blob in enumerate(blobs):
+        rsrc[language_dirs[i]:language_dirs[i] + 24] = directory([(1033, data_entries[i])])
+        rsrc[data_entries[i]:data_entries[i] + 16] = struct.pack("<IIII", section_rva + blob_offsets[i], len(blob), 0, 0)
+        rsrc[blob_offsets[i]:blob_offsets[i] + len(blob)] = blob
+
+    header = bytearray(0x200)
+    header[0:2] = b"MZ"
+    struct.pack_into("<I", header, 0x3C, 0x40)
+    header[0x40:0x44] = b"PE\0\0"
+    optional_size, directories = (240, 112) if pe64 else (224, 96)
+    struct.pack_into("<HHIIIHH", header, 0x44, 0x8664 if pe64 else 0x14C, 1, 0, 0, 0, optional_size, 0x102)
+    struct.pack_into("<H", header, 0x58, 0x20B if pe64 else 0x10B)
+    struct.pack_into("<I", header, 0x58 + directories - 4, 16)
+    struct.pack_into("<II", header, 0x58 + directories + 16, section_rva, len(rsrc))
+    table = 0x58 + optional_size
+    header[table:table + 8] = b".rsrc\0\0\0"
+    struct.pack_into("<IIII", header, table + 8, len(rsrc), section_rva, len(rsrc), 0x200)
+    with open(path, "wb") as f:
+        f.write(bytes(header) + bytes(rsrc))
+
+
+def bench_config(results, workdir):
+    for entries in CONFIG_SIZES:
+        data = sample_config(entries)
+        path = os.path.join(workdir, f"config-{entries}.edl")
+        text = json.dumps(data, indent=4)
+        results[f"config_serialize_{entries}_ms"] = timed(lambda: json.dumps(data, indent=4), 20)
+        results[f"config_write_{entries}_ms"] = timed(lambda: launcher.write_file_atomic(path, text), 20)
+        launcher.CONFIG_FILE = path
+        results[f"config_read_{entries}_ms"] = timed(launcher.read_config, 20)
+
+    # A scripted rename/reorder session: many changes, one write.
+    scheduler = ManualScheduler()
+    data = sample_config(100)
+    store = launcher.ConfigStore(scheduler, lambda: json.dumps(data, indent=4), os.path.join(workdir, "session.edl"))
+    started = time.perf_counter()
+    for i in range(200):
+        data["apps"][i % 100]["custom_name"] = f"Renamed {i}"
+        data["apps"].insert(0, data["apps"].pop())
+        store.mark_dirty()
+    scheduler.run_pending()
+    store.flush()
+    results["config_session_ms"] = (time.perf_counter() - started) * 1000
+    results["config_session_writes"] = store.writes
+
+
+def bench_merge(results):
+    def apps(*names, **fields):
+        return [dict({"path": f"C:/Tools/{name}.exe"}, **fields.get(name, {})) for name in names]
+
+    def expect(case, base, ours, theirs, merged, changes=True):
+        found, changed = launcher.merge_entry_lists(base, ours, theirs, "apps")
+        if found != merged or changed != changes:
+            raise AssertionError(f"Merge ({case}) gave {found}, changed={changed}")
+
+    # Reordered here, renamed in the file: the local order keeps the new name.
+    expect("reorder+rename", apps("a", "b", "c"), apps("c", "a", "b"),
+           apps("a", "b", "c", a={"custom_name": "Alpha"}),
+           apps("c", "a", "b", a={"custom_name": "Alpha"}))
+    # Each side added one entry and removed another.
+    expect("add/delete", apps("a", "b", "c"), apps("a", "c", "d"), apps("a", "b", "e"), apps("a", "e", "d"))
+    # An entry edited on one side survives its removal on the other.
+    expect("edit here, delete there", apps("a", "b"), apps("a", "b", b={"custom_name": "Beta"}), apps("a"),
+           apps("a", "b", b={"custom_name": "Beta"}), changes=False)
+    expect("delete here, edit there", apps("a", "b"), apps("b"), apps("a", "b", a={"custom_name": "Alpha"}),
+           apps("a", "b", a={"custom_name": "Alpha"}))
+    # Launch counts from both sides add up.
+    expect("launch counts", apps("a", a={"launch_count": 5}), apps("a", a={"launch_count": 7}),
+           apps("a", a={"launch_count": 8}), apps("a", a={"launch_count": 10}))
+    expect("unchanged", apps("a", "b"), apps("a", "b"), apps("a", "b"), apps("a", "b"), changes=False)
+
+    for entries in ENTRY_COUNTS:
+        base = sample_config(entries)["apps"]
+        theirs = json.loads(json.dumps(base))
+        theirs[entries // 2]["custom_name"] = "Renamed"
+        results[f"config_merge_{entries}_ms"] = timed(
+            lambda: launcher.merge_entry_lists(base, [dict(item) for item in base], theirs, "apps"), 5)
+
+
+def bench_icons(results, workdir):
+    paths = []
+    for i in range(PE_FILES):
+        path = os.path.join(workdir, f"tool{i}.exe")
+        build_pe(path)
+        paths.append(path)
+
+    # The corpus: PNG and DIB images in PE32 and PE32+ files. The best-fit
+    # image is the smallest at least ICON_SIZE, else the largest.
+    wanted = launcher.ICON_SIZE[0]
+    corpus = {}
+    for dib in (False, True):
+        for pe64 in (False, True):
+            kind = ("dib" if dib else "png") + ("_pe64" if pe64 else "_pe32")
+            for sizes, expected in (((16, 32, 48, 256), 48), ((16, 32, 64, 256), 64), ((16, 32), 32)):
+                path = os.path.join(workdir, f"best-fit-{kind}-{expected}.exe")
+                build_pe(path, sizes, dib=dib, pe64=pe64)
+                corpus.setdefault(kind, path)
+                image = launcher.read_pe_icon(path)
+                pixel = image.getpixel((wanted // 2, wanted // 2))
+                # Resampling may shift a flat colour by a step or two.
+                if image.size != launcher.ICON_SIZE or any(abs(a - b) > 2 for a, b in zip(pixel, (expected % 256, 120, 200, 180))):
+                    raise AssertionError(f"{kind} icon from sizes {sizes} is {image.size} {pixel}, expected the {expected}px image")
+
+    platform = launcher.get_platform()
+    for kind, path in corpus.items():
+        results[f"pe_icon_extract_{kind}_ms"] = timed(lambda: launcher.read_pe_icon(path), 200)
+        if platform.extracts_icons:
+            results[f"gdi_icon_extract_{kind}_ms"] = timed(lambda: platform.extract_icon(path), 200)
+
+    cache = launcher.icon_cache = launcher.IconCache(os.path.join(workdir, "icon_cache"))
+    saves = []
+    save_index = cache._save_index
+    cache._save_index = lambda: saves.append(save_index())
+    results["icon_batch_ms"] = timed(lambda: launcher.extract_icons(paths))
+    if len(saves) != 1:
+        raise AssertionError(f"Icon batch saved the cache index {len(saves)} times")
+    results["icon_cache_hit_ms"] = timed(lambda: launcher.extract_icon(paths[0]), 1000)
+
+    launcher.icon_cache = launcher.IconCache(os.path.join(workdir, "icon_cache"))
+    results["icon_cache_disk_hit_ms"] = timed(lambda: [launcher.extract_icon(path) for path in paths]) / len(paths)
+
+
+def bench_startup(results, workdir):
+    # The __main__ startup sequence minus Tk: config read, icon warm-up for
+    # the PE files from bench_icons, and an update check that must not hold
+    # up the window. Cold runs with an empty icon cache, warm with a full one.
+    data = sample_config(PE_FILES)
+    for i, item in enumerate(data["apps"]):
+        item["path"] = os.path.join(workdir, f"tool{i}.exe")
+    launcher.CONFIG_FILE = os.path.join(workdir, "startup.edl")
+    launcher.write_file_atomic(launcher.CONFIG_FILE, json.dumps(data, indent=4))
+
+    def start():
+        scheduler = ManualScheduler()
+        pipeline = launcher.StartupPipeline(scheduler, min_splash=0)
+        update_check = threading.Event()
+        config = pipeline.stage("config", launcher.read_config)
+        pipeline.run_background("icon_warmup", launcher.warm_app_icons, config)
+        pipeline.run_background("update_check", update_check.wait, required=False)
+        pipeline.when_ready(pipeline.mark_interactive)
+        while "time_to_interactive" not in pipeline.timings:
+            time.sleep(launcher.STARTUP_POLL_MS / 1000)
+            scheduler.run_pending()
+        update_check.set()
+        if "update_check" in pipeline.results:
+            raise AssertionError("Startup waited for the update check")
+        return pipeline.timings
+
+    launcher.icon_cache = launcher.IconCache(os.path.join(workdir, "startup_cache"))
+    timings = start()
+    results["startup_config_ms"] = timings["config"] * 1000
+    results["startup_icon_warmup_ms"] = timings["icon_warmup"] * 1000
+    results["startup_interactive_cold_ms"] = timings["time_to_interactive"] * 1000
+    launcher.icon_cache = launcher.IconCache(os.path.join(workdir, "startup_cache"))
+    results["startup_interactive_warm_ms"] = start()["time_to_interactive"] * 1000
+
+
+# A stand-in for the favicon service: every icon arrives after FAVICON_LATENCY,
+# and hosts starting with "dead" stall past the client's timeout.
+class SlowFaviconHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        domain = self.path.lstrip("/")
+        self.server.requests.append(domain)
+        if domain.startswith("dead"):
+            time.sleep(FAVICON_TIMEOUT * 5)
+            return
+        time.sleep(FAVICON_LATENCY)
+        buffer = io.BytesIO()
+        Image.new("RGBA", (64, 64), "orange").save(buffer, "PNG")
+        body = buffer.getvalue()
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def bench_favicons(results, workdir):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowFaviconHandler)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    saved = launcher.FAVICON_URL, launcher.FAVICON_TIMEOUT
+    launcher.FAVICON_URL = f"http://127.0.0.1:{server.server_port}/{{domain}}"
+    launcher.FAVICON_TIMEOUT = FAVICON_TIMEOUT
+    launcher.icon_cache = launcher.IconCache(os.path.join(workdir, "favicon_cache"))
+    orange = Image.new("RGBA", launcher.ICON_SIZE, "orange").tobytes()
+    try:
+        # The same loader the websites tab builds, over the real fetch path.
+        scheduler = ManualScheduler()
+        loader = launcher.IconLoader(scheduler, launcher.fetch_favicon, launcher.cached_favicon)
+        urls = [f"https://site{i}.example/" for i in range(FAVICON_SITES)]
+        filled = []
+        started = time.perf_counter()
+        for url in urls:
+            loader.request(url, filled.append)
+        results["favicon_first_paint_ms"] = (time.perf_counter() - started) * 1000
+        while len(filled) < FAVICON_SITES:
+            scheduler.run_pending()
+            time.sleep(0.005)
+        results["favicon_all_loaded_ms"] = (time.perf_counter() - started) * 1000
+        if any(image.tobytes() != orange for image in filled):
+            raise AssertionError("Favicon fetch did not decode the served icons")
+        if any(loader.request(url, filled.append) is None for url in urls):
+            raise AssertionError("Fetched favicons were not served from the cache")
+        loader.shutdown()
+
+        # A host that never answers falls back to the default icon after the timeout.
+        started = time.perf_counter()
+        image = launcher.fetch_favicon("https://dead.example/")
+        results["favicon_timeout_ms"] = (time.perf_counter() - started) * 1000
+        if results["favicon_timeout_ms"] > FAVICON_TIMEOUT * 3000:
+            raise AssertionError(f"Dead favicon host took {results['favicon_timeout_ms']:.0f} ms")
+        if image.tobytes() != launcher.default_site_icon().tobytes():
+            raise AssertionError("Dead favicon host did not fall back to the default icon")
+
+        # A refresh cancels everything but the visible sources: queued fetches
+        # never reach the network and cancelled callbacks never fire.
+        loader = launcher.IconLoader(scheduler, launcher.fetch_favicon, launcher.cached_favicon, workers=2)
+        urls = [f"https://slow{i}.example/" for i in range(FAVICON_SITES)]
+        filled = []
+        for url in urls:
+            loader.request(url, lambda image, url=url: filled.append(url))
+        loader.cancel({urls[0]})
+        while loader.pending:
+            scheduler.run_pending()
+            time.sleep(0.005)
+        loader.executor.shutdown(wait=True)
+        loader._poll()
+        fetched = [domain for domain in server.requests if domain.startswith("slow")]
+        if filled != urls[:1] or len(fetched) > loader.workers:
+            raise AssertionError(f"Cancelled favicons still loaded: {filled}, fetched {fetched}")
+        loader.shutdown()
+    finally:
+        launcher.FAVICON_URL, launcher.FAVICON_TIMEOUT = saved
+        server.shutdown()
+
+
+# A stand-in for the GitHub releases API: 200 with an ETag, 304 when the
+# client sends it back, and a stall past the client's timeout when delay is set.
+class ReleaseHandler(http.server.BaseHTTPRequestHandler):
+    etag = '"release-2"'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.headers.get("If-None-Match"))
+        time.sleep(self.server.delay)
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"tag_name": "v2.1.0"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def bench_update_check(results, workdir):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ReleaseHandler)
+    server.requests, server.delay = [], 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state_path = os.path.join(workdir, "update_check.json")
+
+    def check(interval=0):
+        return launcher.fetch_latest_version(f"http://127.0.0.1:{server.server_port}/", state_path,
+                                             interval=interval, timeout=UPDATE_TIMEOUT)
+
+    def expect(name, func, version, sent):
+        count = len(server.requests)
+        started = time.perf_counter()
+        found = func()
+        results[f"update_check_{name}_ms"] = (time.perf_counter() - started) * 1000
+        if found != version or server.requests[count:] != sent:
+            raise AssertionError(f"Update check ({name}) returned {found!r} after requests {server.requests[count:]}")
+
+    try:
+        expect("200", check, "2.1.0", [None])
+        expect("304", check, "2.1.0", [ReleaseHandler.etag])
+        expect("cached", lambda: check(interval=3600), "2.1.0", [])
+        server.delay = UPDATE_TIMEOUT * 2
+        expect("timeout", check, "2.1.0", [ReleaseHandler.etag])
+    finally:
+        server.shutdown()
+
+
+def bench_watcher(results):
+    watchers = [("polling", launcher.PollingWatcher())]
+    if os.path.isdir("/proc"):
+        watchers.append(("procfs", launcher.ProcfsWatcher()))
+    for name, watcher in watchers:
+        known = {}
+        watcher.poll(known, lambda pid, n: None, lambda pid, n: None)
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        for _ in range(WATCHER_POLLS):
+            watcher.poll(known, lambda pid, n: None, lambda pid, n: None)
+        per_poll = (time.process_time() - cpu) / WATCHER_POLLS
+        results[f"watcher_{name}_poll_ms"] = (time.perf_counter() - wall) / WATCHER_POLLS * 1000
+        results[f"watcher_{name}_cpu_s_per_hour"] = per_poll * 3600 / watcher.max_interval
+
+    # Detection latency against a spawned process while the poller is idle.
+    watcher = launcher.ProcfsWatcher() if os.path.isdir("/proc") else launcher.PollingWatcher()
+    seen = threading.Event()
+    child = {}
+
+    def started(pid, name):
+        if pid == child.get("pid"):
+            seen.set()
+
+    thread = threading.Thread(target=watcher.run, args=(started, lambda pid, name: None), daemon=True)
+    thread.start()
+    time.sleep(watcher.max_interval)
+    spawned = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    child["pid"] = proc.pid
+    seen.wait(watcher.max_interval * 2)
+    results["watcher_detect_latency_ms"] = (time.perf_counter() - spawned) * 1000
+    watcher.stop()
+    proc.kill()
+    proc.wait()
+
+
+def bench_sampler(results):
+    children = [subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"]) for _ in range(SAMPLER_PROCS)]
+    try:
+        # The children are found from watcher-style start events, as in the app.
+        exe = os.path.realpath(sys.executable)
+        sampler = launcher.ProcessSampler()
+        sampler.watch([exe])
+
+        def discover():
+            for child in children:
+                sampler.on_process_start(child.pid, os.path.basename(exe))
+            sampler.tick()
+        results["sampler_discovery_ms"] = timed(discover)
+        if len(sampler.procs) != SAMPLER_PROCS:
+            raise AssertionError(f"Sampler found {len(sampler.procs)} of {SAMPLER_PROCS} processes")
+
+        cpu = time.process_time()
+        per_tick = timed(sampler.tick, SAMPLER_TICKS)
+        cpu_per_tick = (time.process_time() - cpu) / SAMPLER_TICKS
+        results[f"sampler_tick_{len(sampler.procs)}_procs_ms"] = per_tick
+        results["sampler_tick_per_proc_us"] = per_tick * 1000 / max(1, len(sampler.procs))
+        results["sampler_cpu_s_per_hour"] = cpu_per_tick * 3600 / max(sampler.min_interval, cpu_per_tick / sampler.budget)
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
+
+
+def bench_triggers(results):
+    # Synthetic start/exit events for 300 process names, none matched, plus
+    # one game session that fires a start and a stop rule.
+    for count in TRIGGER_RULES:
+        rules = [{"process": f"tool{i}.exe", "start": ["tool"]} for i in range(count)]
+        rules.append({"process": "EliteDangerous64.exe", "match": "odyssey", "start": ["tool"], "stop": ["tool"]})
+        fired = []
+        engine = launcher.TriggerEngine(rules, lambda rule, event: fired.append(event),
+                                        cmdline=lambda pid: "elite-dangerous-odyssey-64/EliteDangerous64.exe")
+
+        def session():
+            for pid in range(TRIGGER_EVENTS):
+                engine.on_start(pid, f"proc{pid % 300}.exe")
+            engine.on_start(TRIGGER_EVENTS, "EliteDangerous64.exe")
+            engine.on_exit(TRIGGER_EVENTS, "EliteDangerous64.exe")
+            for pid in range(TRIGGER_EVENTS):
+                engine.on_exit(pid, f"proc{pid % 300}.exe")
+        results[f"trigger_event_{count}_rules_us"] = timed(session) * 1000 / (TRIGGER_EVENTS * 2 + 2)
+        if fired != ["start", "stop"]:
+            raise AssertionError(f"Trigger rules fired {fired}")
+
+
+def bench_autolaunch(results):
+    # Stub spawn and snapshot, one worker: ordering, dependencies (including
+    # a plain string), a delay that must not hold up the worker, skipping a
+    # running app, a cycle, and values that are not numbers.
+    def app(name, **fields):
+        return dict(path=f"C:/Tools/{name}.exe", **fields)
+
+    apps = [app("Later", launch_order=2), app("Alpha", launch_order=1), app("Beta", launch_after="Alpha"),
+            app("Delayed", launch_delay=0.3), app("Quick"), app("Running"),
+            app("Ping", launch_after=["Pong"]), app("Pong", launch_after=["Ping"]),
+            app("Odd", launch_order="first", launch_delay="x")]
+    spawned = {}
+
+    def spawn(path):
+        started = time.perf_counter()
+        time.sleep(AUTO_LAUNCH_SPAWN)
+        spawned[os.path.basename(path)] = (started, time.perf_counter())
+
+    orchestrator = launcher.AutoLaunchOrchestrator(spawn, lambda: {launcher.app_key("C:/Tools/Running.exe")}, workers=1)
+    plan = orchestrator.plan(apps)
+    deps = {launcher.entry_name(item, "apps"): [launcher.entry_name(dep, "apps") for dep in found] for item, found in plan}
+    order = [launcher.entry_name(item, "apps") for item, _ in plan]
+    if order.index("Alpha") > order.index("Later") or deps["Beta"] != ["Alpha"] or len(deps["Ping"]) + len(deps["Pong"]) != 1:
+        raise AssertionError(f"Auto-launch plan {order} with dependencies {deps}")
+
+    started = time.perf_counter()
+    status = {result["name"]: result["status"] for result in orchestrator.run(apps)}
+    results["autolaunch_run_ms"] = (time.perf_counter() - started) * 1000
+    if status.pop("Running") != "running" or set(status.values()) != {"launched"} or "Running.exe" in spawned:
+        raise AssertionError(f"Auto-launch statuses {status}")
+    if spawned["Beta.exe"][0] < spawned["Alpha.exe"][1]:
+        raise AssertionError("Beta started before Alpha finished")
+    if spawned["Delayed.exe"][0] - started < 0.3:
+        raise AssertionError("Delayed started before its launch_delay")
+    if spawned["Quick.exe"][0] > spawned["Delayed.exe"][0]:
+        raise AssertionError("launch_delay held up the only worker")
+
+    chain = [app(f"tool{i}", launch_order=-i, launch_after=[f"tool{i - 1}"] if i % 10 else []) for i in range(AUTO_LAUNCH_APPS)]
+    results[f"autolaunch_plan_{AUTO_LAUNCH_APPS}_ms"] = timed(lambda: orchestrator.plan(chain))
+
+
+def search_entries(count):
+    import random
+    rng = random.Random(7)
+    apps, sites = [], []
+    for i in range(count):
+        words = rng.sample(SEARCH_WORDS, 3)
+        if i % 2:
+            apps.append({"path": f"C:/Tools/{words[0]}{i}/{''.join(words)}.exe",
+                         "custom_name": " ".join(words).title()})
+        else:
+            sites.append({"url": f"https://www.{words[0]}-{words[1]}{i}.example.com/"})
+        # Half have been launched, so ranking has something to sort by.
+        if i % 4 < 2:
+            (apps if i % 2 else sites)[-1].update(launch_count=rng.randint(1, 50),
+                                                  last_launched=time.time() - rng.randint(0, 90) * 86400)
+    return apps, sites
+
+
+def bench_search(results):
+    # Fuzzy queries ("edd", "eldis", "mktcon") must stay under the budget
+    # at SEARCH_ENTRIES entries, and a rename must only re-index one entry.
+    apps, sites = search_entries(SEARCH_ENTRIES)
+
+    def build():
+        built = launcher.SearchIndex()
+        built.sync("apps", apps)
+        built.sync("websites", sites)
+        built.ranked()
+        return built
+    results[f"search_build_{SEARCH_ENTRIES}_ms"] = timed(build)
+    index = build()
+
+    # Best of a few rounds, so a busy machine doesn't fail the budget.
+    slowest = 0.0
+    for query in SEARCH_QUERIES:
+        took = min(timed(lambda: index.search(query), 20) for _ in range(5))
+        results[f"search_{query}_ms"] = took
+        slowest = max(slowest, took)
+    if slowest > SEARCH_BUDGET_MS:
+        raise AssertionError(f"Slowest search took {slowest:.2f} ms, over the {SEARCH_BUDGET_MS} ms budget")
+
+    def rename():
+        apps[0]["custom_name"] = f"Renamed {time.perf_counter()}"
+        index.sync("apps", apps)
+    results["search_sync_rename_ms"] = timed(rename, 20)
+    found = index.search(apps[0]["custom_name"])
+    if not found or found[0][0] is not apps[0]:
+        raise AssertionError("Renamed entry not found after sync")
+
+
+class BenchParent:
+    def __init__(self, root, entries):
+        from tkinter import ttk
+        self.root = root
+        self.notebook = ttk.Notebook(root)
+        self.notebook.pack(fill="both", expand=True)
+        self.grid_columns = launcher.tk.IntVar(value=5)
+        self.photo_pool = launcher.PhotoImagePool()
+        self.sampler = None
+        self.data = {"apps": [{"path": f"C:/Tools/tool{i}.exe", "launch_with_ed": i % 3 == 0} for i in range(entries)]}
+
+    def save_config(self):
+        pass
+
+    def on_items_changed(self, tab):
+        pass
+
+
+def stub_icon(source):
+    return Image.new("RGBA", launcher.ICON_SIZE, (hash(source) % 256, 80, 160, 255))
+
+
+def bench_tk(results):
+    try:
+        root = launcher.tk.Tk()
+    except launcher.tk.TclError as e:
+        print(f"Skipping Tk benchmarks: {e}", file=sys.stderr)
+        return
+    root.geometry("500x400")
+    process = psutil.Process()
+    for entries in ENTRY_COUNTS:
+        parent = BenchParent(root, entries)
+        tab = launcher.LauncherTab(parent, "apps", "apps", launcher.APP_BORDER, stub_icon, lambda key: None)
+        root.update()
+
+        # tracemalloc sees only Python objects; RSS also covers Tk's widgets.
+        rss = process.memory_info().rss
+        tracemalloc.start()
+        started = time.perf_counter()
+        tab.load()
+        root.update()
+        results[f"refresh_first_{entries}_ms"] = (time.perf_counter() - started) * 1000
+        results[f"refresh_peak_{entries}_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+        results[f"refresh_rss_{entries}_kb"] = (process.memory_info().rss - rss) / 1024
+
+        results[f"refresh_steady_{entries}_ms"] = timed(tab.refresh, 20)
+        results[f"refresh_widgets_{entries}"] = len(tab.cells) + len(tab.spare)
+
+        # Synthetic <B1-Motion> events go through on_drag_motion's hit test,
+        # swapping the first two cells back and forth.
+        tab.enter_rearrange_mode()
+        labels = sorted((cell["label"] for cell in tab.cells.values()), key=lambda label: label._item_index)
+        slots = [(label.winfo_rootx() + label.winfo_width() // 2, label.winfo_rooty() + label.winfo_height() // 2)
+                 for label in labels[:2]]
+        tab.on_drag_start(types.SimpleNamespace(widget=labels[0]), 0)
+        moves = []
+
+        def move():
+            x, y = slots[1 - tab.drag_data["index"]]
+            tab.on_drag_motion(types.SimpleNamespace(widget=labels[0], x_root=x, y_root=y))
+            moves.append(tab.drag_data["index"])
+        results[f"drag_motion_{entries}_ms"] = timed(move, 50)
+        if len(set(moves)) != 2:
+            raise AssertionError(f"Drag motion did not reorder the grid ({entries} entries)")
+
+        # Near the bottom edge every motion event also scrolls the canvas.
+        bottom = tab.canvas.winfo_rooty() + tab.canvas.winfo_height() - 1
+        def edge():
+            tab.on_drag_motion(types.SimpleNamespace(widget=labels[0], x_root=slots[0][0], y_root=bottom))
+        results[f"drag_edge_scroll_{entries}_ms"] = timed(edge, 50)
+        tab.cancel_rearrange()
+
+        def scroll():
+            tab.canvas.yview_scroll(1, "units")
+            tab.refresh()
+        results[f"scroll_step_{entries}_ms"] = timed(scroll, 50)
+
+        parent.notebook.destroy()
+    root.destroy()
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, base in sorted(baseline.items()):
+        current = results.get(name)
+        if current is None or base <= 0:
+            continue
+        change = (current - base) / base
+        status = "REGRESSED" if change > threshold else "ok"
+        print(f"{name:40} {base:12.3f} {current:12.3f} {change:+8.1%}  {status}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the launcher's hot paths")
+    parser.add_argument("--save", metavar="FILE", help="write results to FILE as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare results against a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a metric counts as regressed (default: 0.25)")
+    parser.add_argument("--skip-tk", action="store_true", help="skip benchmarks that need a display")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS, metavar="MS",
+                        help=f"fail when importing launcher takes longer (default: {IMPORT_BUDGET_MS})")
+    args = parser.parse_args(argv)
+
+    results = {"import_launcher_ms": import_time_ms()}
+    workdir = tempfile.mkdtemp(prefix="edl-bench-")
+    config_file = launcher.CONFIG_FILE
+    try:
+        bench_config(results, workdir)
+        bench_merge(results)
+        bench_icons(results, workdir)
+        bench_startup(results, workdir)
+        bench_favicons(results, workdir)
+        bench_update_check(results, workdir)
+        bench_watcher(results)
+        bench_sampler(results)
+        bench_triggers(results)
+        bench_autolaunch(results)
+        bench_search(results)
+        if not args.skip_tk:
+            bench_tk(results)
+    finally:
+        launcher.CONFIG_FILE = config_file
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(json.dumps(results, indent=4, sort_keys=True))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+    status = 0
+    if results["import_launcher_ms"] > args.import_budget:
+        print(f"Importing launcher took {results['import_launcher_ms']:.1f} ms, over the "
+              f"{args.import_budget:g} ms budget", file=sys.stderr)
+        status = 1
+    if args.compare:
+        with open(args.compare, "r") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}", file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,24 @@
 import tkinter as tk
 from tkinter import filedialog, simpledialog, messagebox, Menu, ttk
 import os
-import subprocess
 import json
-import webbrowser
-from PIL import Image, ImageTk
-import urllib.request
 import io
-import win32gui
-import win32ui
-import win32con
-import psutil
-import pystray
-from pystray import MenuItem as TrayMenuItem
 import threading
+import sys
 import time
-import requests
 import random
+import functools
+import bisect
+import re
+import queue
+import struct
+import tempfile
+import contextlib
+from collections import Counter, OrderedDict, defaultdict, deque
+
+# PIL, subprocess, webbrowser, concurrent.futures, argparse and the other
+# feature-only modules are imported where they are used; benchmark.py fails
+# when importing this module goes over its startup budget.
 
 CONFIG_FILE = "data.edl"
 ICON_SIZE = (48, 48)
@@ -26,100 +28,2062 @@ APP_BORDER = "#fe9020"
 WEB_BORDER = "#00ff00"
 HIGHLIGHT_BORDER = "#ffcc00"
 BORDER_WIDTH = 3
+CELL_SIZE = (84, 84)
+CELL_PAD = 8
+OVERSCAN_ROWS = 2
 ICON_PATH = "images/icon.png"
 ED_LAUNCHER_NAME = "EDLaunch.exe"
 CURRENT_VERSION = "2.0.0"
+UPDATE_URL = "https://api.github.com/repos/DRA6N/ED-Launcher/releases/latest"
+RELEASES_URL = "https://github.com/DRA6N/ED-Launcher/releases"
+UPDATE_STATE_FILE = os.path.join(os.path.dirname(CONFIG_FILE), "update_check.json")
+UPDATE_INTERVAL = 24 * 60 * 60
+UPDATE_TIMEOUT = 5
+ICON_CACHE_DIR = os.path.join(os.path.dirname(CONFIG_FILE), "icon_cache")
+ICON_CACHE_INDEX = "index.json"
+ICON_CACHE_MAX_BYTES = 8 * 1024 * 1024
+FAVICON_URL = "https://www.google.com/s2/favicons?domain={domain}&sz=64"
+FAVICON_TIMEOUT = 4
+FAVICON_WORKERS = 6
+ICON_POLL_MS = 50
+WATCH_MIN_INTERVAL = 1.0
+WATCH_MAX_INTERVAL = 2.0
+SPLASH_MIN_SECONDS = 1.0
+STARTUP_POLL_MS = 20
+SAVE_DELAY_MS = 500
+RT_ICON = 3
+RT_GROUP_ICON = 14
+PHOTO_POOL_SIZE = 512
+INSTANCE_NAME = "ed-launcher"
+IPC_TIMEOUT = 2.0
+DISPATCH_POLL_MS = 100
+AUTO_LAUNCH_WORKERS = 4
+TRACE_MAX_EVENTS = 100000
+PERF_PANEL_REFRESH_MS = 1000
+SEARCH_PREFIX_MAX = 16
+PALETTE_RESULTS = 10
+SAMPLE_MIN_INTERVAL = 1.0
+SAMPLE_MAX_INTERVAL = 5.0
+SAMPLE_BUDGET = 0.01
+RUNNING_COLOR = "#3cff3c"
+TOOLTIP_DELAY_MS = 400
+IMPORT_SCAN_LIMIT = 500
+CONFIG_POLL_INTERVAL = 1.0
+CONFIG_SETTLE_SECONDS = 0.2
+TRIGGER_CLOSE_TIMEOUT = 10
+IMPORT_SKIP = re.compile(r"unins|setup|install|update|crash|redist|helper", re.IGNORECASE)
+
+# Lightweight spans for finding where time goes. While disabled, traced()
+# functions cost one attribute check; when enabled, spans are kept for a
+# Chrome trace export (chrome://tracing, Perfetto) and aggregated per name.
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+class Tracer:
+    def __init__(self, max_events=TRACE_MAX_EVENTS):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def record(self, name, start_ns, end_ns, args=None):
+        duration = end_ns - start_ns
+        self.events.append((name, start_ns, duration, threading.get_ident(), args))
+        with self.lock:
+            stat = self.stats.setdefault(name, [0, 0, 0])
+            stat[0] += 1
+            stat[1] += duration
+            stat[2] = max(stat[2], duration)
+
+    def hot_spots(self, limit=15):
+        with self.lock:
+            rows = [(name, count, total / 1e6, total / count / 1e6, peak / 1e6)
+                    for name, (count, total, peak) in self.stats.items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:limit]
+
+    def reset(self):
+        self.events.clear()
+        with self.lock:
+            self.stats.clear()
+
+    def export(self, path):
+        pid = os.getpid()
+        events = [{"name": name, "ph": "X", "ts": start // 1000, "dur": duration / 1000,
+                   "pid": pid, "tid": tid, "args": args or {}}
+                  for name, start, duration, tid, args in list(self.events)]
+        write_file_atomic(path, json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+_NULL_SPAN = _NullSpan()
+tracer = Tracer()
+
+def traced(name):
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def version_tuple(version):
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return None
+
+def is_newer_version(latest_version):
+    if not latest_version:
+        return False
+    latest, current = version_tuple(latest_version), version_tuple(CURRENT_VERSION)
+    if latest is None or current is None:
+        return latest_version != CURRENT_VERSION
+    return latest > current
+
+def read_update_state(path=UPDATE_STATE_FILE):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Asks GitHub for the latest release at most once per UPDATE_INTERVAL. The
+# ETag and Last-Modified of the last answer are kept so a repeat check is a
+# conditional request that comes back 304 without a body. Errors and
+# timeouts return the last known version.
+@traced("update_check")
+def fetch_latest_version(url=UPDATE_URL, state_path=UPDATE_STATE_FILE, interval=UPDATE_INTERVAL, timeout=UPDATE_TIMEOUT):
+    import requests
+
+    state = read_update_state(state_path)
+    now = time.time()
+    if now - state.get("checked_at", 0) < interval:
+        return state.get("latest_version")
+
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"Update check failed: {e}")
+        return state.get("latest_version")
+
+    if response.status_code == 200:
+        state["latest_version"] = response.json().get("tag_name", "").lstrip("v")
+        state["etag"] = response.headers.get("ETag")
+        state["last_modified"] = response.headers.get("Last-Modified")
+    elif response.status_code != 304:
+        return state.get("latest_version")
+    state["checked_at"] = now
+    try:
+        write_file_atomic(state_path, json.dumps(state, indent=4))
+    except OSError as e:
+        print(f"Failed to save update state: {e}")
+    return state.get("latest_version")
 
-def check_for_updates():
+@traced("config.read")
+def read_config():
+    if os.path.exists(CONFIG_FILE):
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    return {}
+
+def entry_name(item, type_):
+    name = item.get("custom_name")
+    if not name:
+        key = "path" if type_ == "apps" else "url"
+        name = os.path.splitext(os.path.basename(item[key]))[0] if type_ == "apps" else url_domain(item[key])
+    return name
+
+def entry_aliases(item, type_):
+    aliases = [entry_name(item, type_)]
+    if type_ == "apps":
+        aliases.append(os.path.splitext(os.path.basename(item.get("path", "")))[0])
+    else:
+        domain = url_domain(item.get("url", "")).lower()
+        if domain.startswith("www."):
+            domain = domain[4:]
+        aliases += [domain, domain.split(".")[0]]
+    return [alias.casefold() for alias in aliases if alias]
+
+def resolve_entry(items, query, type_):
+    query = query.casefold()
+    for match in (lambda alias: alias == query, lambda alias: alias.startswith(query)):
+        for item in items:
+            if any(match(alias) for alias in entry_aliases(item, type_)):
+                return item
+    return None
+
+def frecency(item, now=None):
+    count = item.get("launch_count", 0)
+    if not count:
+        return 0.0
+    age_days = max(0.0, ((now or time.time()) - item.get("last_launched", 0)) / 86400)
+    return count / (1 + age_days / 7)
+
+# Matches text containing the query's characters in order, e.g. "edd" in
+# "elite dangerous discovery", within one line. Each gap only skips
+# characters other than the next one, so a failed match never backtracks.
+def subsequence_pattern(query):
+    return re.compile(re.escape(query[:1]) + "".join(f"[^{re.escape(c)}\\n]*{re.escape(c)}" for c in query[1:]))
+
+
+# In-memory search over apps and websites. Whole aliases and the words in
+# them are indexed by prefix, and every entry by (character, count) pairs for
+# the most times a character appears in one alias, so a fuzzy query only runs
+# its pattern on entries with enough of each letter. A lookup is a dict hit
+# plus a walk of a usage ranking kept sorted as entries come and go, which
+# stops once enough results are found. sync() only re-indexes entries that
+# were added, removed or renamed.
+class SearchIndex:
+    def __init__(self):
+        self.entries = {}
+        self.typed = defaultdict(dict)
+        self.alias_prefixes = defaultdict(set)
+        self.prefixes = defaultdict(set)
+        self.chars = defaultdict(set)
+        self.order = None
+        self.sort_keys = {}
+        self.ordered_at = 0
+        self.ranking = []
+        self.rank = None
+
+    def _tokens(self, aliases):
+        tokens = set(aliases)
+        for alias in aliases:
+            tokens.update(word for word in re.split(r"[^0-9a-z]+", alias) if word)
+        return tokens
+
+    def _char_counts(self, texts):
+        # (char, n) for n up to the most times char appears in one text.
+        most = {}
+        for text in texts:
+            for char, count in Counter(text.replace(" ", "")).items():
+                if count > most.get(char, 0):
+                    most[char] = count
+        return {(char, n) for char, count in most.items() for n in range(1, count + 1)}
+
+    def _index(self, key, aliases, add):
+        tables = (
+            (self.alias_prefixes, {alias[:i] for alias in aliases for i in range(1, min(len(alias), SEARCH_PREFIX_MAX) + 1)}),
+            (self.prefixes, {token[:i] for token in self._tokens(aliases)
+                             for i in range(1, min(len(token), SEARCH_PREFIX_MAX) + 1)}),
+            (self.chars, self._char_counts(aliases)),
+        )
+        for table, terms in tables:
+            if add:
+                for term in terms:
+                    table[term].add(key)
+                continue
+            for term in terms:
+                keys = table.get(term)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del table[term]
+
+    def _signature(self, item, type_):
+        # The fields entry_aliases() reads.
+        return item.get("custom_name"), item.get("path" if type_ == "apps" else "url")
+
+    def _sort_key(self, key, now):
+        item, _, aliases = self.entries[key][:3]
+        return (-frecency(item, now), aliases[0] if aliases else "", key)
+
+    def add(self, item, type_):
+        aliases = tuple(dict.fromkeys(entry_aliases(item, type_)))
+        key = id(item)
+        entry = self.entries[key] = self.typed[type_][key] = (item, type_, aliases, "\n".join(aliases),
+                                                             self._signature(item, type_))
+        self._index(key, aliases, True)
+        if self.order is not None:
+            sort_key = self.sort_keys[key] = self._sort_key(key, self.ordered_at)
+            bisect.insort(self.order, sort_key)
+            self.rank = None
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry:
+            del self.typed[entry[1]][key]
+            self._index(key, entry[2], False)
+            sort_key = self.sort_keys.pop(key, None)
+            if self.order is not None and sort_key is not None:
+                del self.order[bisect.bisect_left(self.order, sort_key)]
+                self.rank = None
+
+    def sync(self, type_, items):
+        # Entries are compared by identity and the fields their aliases come
+        # from, so only added, removed and renamed ones are re-indexed.
+        live = {id(item): item for item in items}
+        field = "path" if type_ == "apps" else "url"
+        stale = [key for key, (item, _, _, _, signature) in self.typed[type_].items()
+                 if live.get(key) is not item or (item.get("custom_name"), item.get(field)) != signature]
+        for key in stale:
+            self.remove(key)
+        for key, item in live.items():
+            if key not in self.entries:
+                self.add(item, type_)
+
+    def touch(self):
+        self.order = None
+
+    def ranked(self):
+        # Usage ranking, rebuilt after launches and hourly as recency decays.
+        # Adds and removes keep the sorted keys in place; the flat ranking and
+        # positions are derived from them on the next search.
+        now = time.time()
+        if self.order is None or now - self.ordered_at > 3600:
+            self.sort_keys = {key: self._sort_key(key, now) for key in self.entries}
+            self.order = sorted(self.sort_keys.values())
+            self.ordered_at = now
+            self.rank = None
+        if self.rank is None:
+            self.ranking = [sort_key[-1] for sort_key in self.order]
+            self.rank = {key: i for i, key in enumerate(self.ranking)}
+        return self.ranking
+
+    def _top(self, keys, limit, accept=None):
+        # Few candidates are sorted directly; many are found by walking the
+        # ranking, which stops early.
+        order = self.ranked()
+        if len(keys) <= max(limit * 8, len(order) // 8):
+            order = sorted(keys, key=self.rank.__getitem__)
+        found = []
+        for key in order:
+            if key in keys and (accept is None or accept(key)):
+                found.append(key)
+                if len(found) == limit:
+                    break
+        return found
+
+    def search(self, query, limit=PALETTE_RESULTS):
+        query = query.casefold().strip()
+        if not query:
+            return [self.entries[key][:2] for key in self.ranked()[:limit]]
+
+        check = None
+        if len(query) > SEARCH_PREFIX_MAX:
+            check = lambda key: any(token.startswith(query) for token in self._tokens(self.entries[key][2]))
+        keys = self._top(self.alias_prefixes.get(query[:SEARCH_PREFIX_MAX], set()), limit, check)
+        if len(keys) < limit:
+            words = self.prefixes.get(query[:SEARCH_PREFIX_MAX], set()).difference(keys)
+            keys += self._top(words, limit - len(keys), check)
+        if len(keys) < limit:
+            # The two rarest (character, count) terms narrow the candidates;
+            # the pattern checks the rest. It runs once per entry, whose
+            # aliases are joined by newlines that it doesn't cross.
+            compact = query.replace(" ", "")
+            sets = sorted((self.chars.get(term, set()) for term in self._char_counts([compact])), key=len)
+            candidates = set.intersection(*sets[:2]).difference(keys) if sets else set()
+            pattern = subsequence_pattern(compact)
+            keys += self._top(candidates, limit - len(keys), lambda key: pattern.search(self.entries[key][3]))
+        return [self.entries[key][:2] for key in keys]
+
+def write_file_atomic(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".data.", suffix=".tmp", dir=directory)
     try:
-        response = requests.get("https://api.github.com/repos/DRA6N/ED-Launcher/releases/latest", timeout=5)
-        if response.status_code == 200:
-            latest_version = response.json().get("tag_name", "").lstrip("v")
-            if latest_version and latest_version != CURRENT_VERSION:
-                if messagebox.askokcancel("Update Available", "A new version is available.\nClick OK to open the download page."):
-                    webbrowser.open("https://github.com/DRA6N/ED-Launcher/releases")
-    except:
-        pass
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
-def extract_icon(path):
+
+def file_signature(path):
     try:
-        large, small = win32gui.ExtractIconEx(path, 0)
-        hicon = small[0] if small else large[0]
-        hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
-        hbmp = win32ui.CreateBitmap()
-        hbmp.CreateCompatibleBitmap(hdc, ICON_SIZE[0], ICON_SIZE[1])
-        hdc = hdc.CreateCompatibleDC()
-        hdc.SelectObject(hbmp)
-        win32gui.DrawIconEx(hdc.GetHandleOutput(), 0, 0, hicon, ICON_SIZE[0], ICON_SIZE[1], 0, None, win32con.DI_NORMAL)
-        bmpinfo = hbmp.GetInfo()
-        bmpstr = hbmp.GetBitmapBits(True)
-        image = Image.frombuffer('RGB', (bmpinfo['bmWidth'], bmpinfo['bmHeight']), bmpstr, 'raw', 'BGRX', 0, 1)
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+# Write-behind persistence for the config. mark_dirty() coalesces bursts of
+# changes into one snapshot taken on the Tk thread after SAVE_DELAY_MS; the
+# snapshot is written by a background thread via temp file + fsync + rename.
+# ``synced`` is the text last read from or written to disk. If the file has
+# changed since then, the write is skipped and on_conflict() is called so the
+# external edit can be merged first.
+class ConfigStore:
+    def __init__(self, root, serialize, path=CONFIG_FILE, delay_ms=SAVE_DELAY_MS):
+        self.root = root
+        self.serialize = serialize
+        self.path = path
+        self.delay_ms = delay_ms
+        self.after_id = None
+        self.pending = None
+        self.writing = False
+        self.cond = threading.Condition()
+        self.thread = None
+        self.writes = 0
+        self.write_seconds = 0.0
+        self.synced = None
+        self.synced_sig = None
+        self.on_conflict = None
+
+    def mark_synced(self, text, signature):
+        with self.cond:
+            self.synced = text
+            self.synced_sig = signature
+
+    def discard_pending(self):
+        with self.cond:
+            self.pending = None
+
+    def mark_dirty(self):
+        if self.after_id is None:
+            self.after_id = self.root.after(self.delay_ms, self._snapshot)
+
+    def _snapshot(self):
+        self.after_id = None
+        payload = self.serialize()
+        with self.cond:
+            self.pending = payload
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="config-writer", daemon=True)
+                self.thread.start()
+            self.cond.notify()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while self.pending is None:
+                    self.cond.wait()
+                payload, self.pending = self.pending, None
+                self.writing = True
+            try:
+                self._write(payload)
+            except OSError as e:
+                print(f"Failed to save config: {e}")
+            finally:
+                with self.cond:
+                    self.writing = False
+                    self.cond.notify_all()
+
+    @traced("config.write")
+    def _write(self, payload, force=False):
+        if not force and self.on_conflict and file_signature(self.path) != self.synced_sig:
+            self.on_conflict()
+            return False
+        started = time.perf_counter()
+        write_file_atomic(self.path, payload)
+        self.mark_synced(payload, file_signature(self.path))
+        self.writes += 1
+        self.write_seconds += time.perf_counter() - started
+        return True
+
+    # Writes anything pending now. Returns False if the write was skipped
+    # because the file changed on disk, unless ``force`` overrides that.
+    def flush(self, force=False):
+        payload = None
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+            payload = self.serialize()
+        with self.cond:
+            if payload is None:
+                payload = self.pending
+            self.pending = None
+            while self.writing:
+                self.cond.wait()
+        if payload is not None:
+            return self._write(payload, force)
+        return True
+
+# Three-way merge of a config reloaded from disk. ``base`` is the config as
+# last read or written, ``ours`` the in-memory one and ``theirs`` the new file.
+# External changes are applied unless the same value was also changed here;
+# launch counts from both sides are added up. Entries are matched by
+# normalized path or URL and updated in place, so open tiles keep their cells.
+_MISSING = object()
+
+def merge_value(base, ours, theirs):
+    return ours if theirs == base else theirs
+
+def merge_fields(base, ours, theirs):
+    changed = False
+    for field in set(base) | set(theirs):
+        old, new, mine = base.get(field, _MISSING), theirs.get(field, _MISSING), ours.get(field, _MISSING)
+        if new == old or new == mine:
+            continue
+        if field == "launch_count":
+            new = max(0, (mine if mine is not _MISSING else 0) + (new if new is not _MISSING else 0)
+                      - (old if old is not _MISSING else 0))
+        elif field == "last_launched" and mine is not _MISSING and new is not _MISSING:
+            new = max(mine, new)
+        elif mine != old:
+            print(f"Config conflict on '{field}', keeping the value from {CONFIG_FILE}")
+        if new is _MISSING:
+            ours.pop(field, None)
+        else:
+            ours[field] = new
+        changed = True
+    return changed
+
+def _keyed_entries(items, type_):
+    keyed, seen = {}, {}
+    for item in items:
+        key = entry_key(item, type_) or ""
+        seen[key] = seen.get(key, -1) + 1
+        keyed[(key, seen[key])] = item
+    return keyed
+
+def merge_entry_lists(base, ours, theirs, type_):
+    base, mine, new = (_keyed_entries(items, type_) for items in (base, ours, theirs))
+    changed = False
+    keep = {}
+    for key in list(mine) + [key for key in new if key not in mine]:
+        old = base.get(key)
+        if key in mine and key in new:
+            changed = merge_fields(old or {}, mine[key], new[key]) or changed
+            keep[key] = mine[key]
+        elif key in mine:
+            # Removed externally: dropped unless it was edited here.
+            if old is None or mine[key] != old:
+                keep[key] = mine[key]
+            else:
+                changed = True
+        elif old is None or new[key] != old:
+            # Added (or edited after a local removal) externally.
+            keep[key] = dict(new[key])
+            changed = True
+
+    # Keep a local rearrangement; otherwise follow the file's order.
+    reordered = [key for key in mine if key in base] != [key for key in base if key in mine]
+    order = list(mine) + list(new) if reordered else list(new) + list(mine)
+    merged = [keep[key] for key in dict.fromkeys(order) if key in keep]
+    changed = changed or [id(item) for item in merged] != [id(item) for item in ours]
+    return merged, changed
+
+
+# Watches one file and calls on_change() from its thread when it is replaced
+# or rewritten. This base class polls the file's stat signature.
+class FileWatcher:
+    def __init__(self, path, interval=CONFIG_POLL_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def emit(self, on_change):
+        try:
+            on_change()
+        except Exception as e:
+            print(f"File watcher callback failed: {e}")
+
+    def run(self, on_change):
+        last = file_signature(self.path)
+        while not self.stop_event.wait(self.interval):
+            signature = file_signature(self.path)
+            if signature != last:
+                last = signature
+                self.emit(on_change)
+
+
+# Linux backend using inotify on the file's directory, which also sees atomic
+# replaces. Events are coalesced over CONFIG_SETTLE_SECONDS since editors
+# often save in several steps.
+class InotifyFileWatcher(FileWatcher):
+    MASK = 0x8 | 0x80 | 0x100 | 0x200  # IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def run(self, on_change):
+        import ctypes
+        import select
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            if libc.inotify_add_watch(fd, os.fsencode(directory), self.MASK) < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            name = os.fsencode(os.path.basename(self.path))
+            while not self.stop_event.is_set():
+                if not select.select([fd], [], [], 1.0)[0] or not self.read_events(fd, name):
+                    continue
+                self.stop_event.wait(CONFIG_SETTLE_SECONDS)
+                self.read_events(fd, name)
+                self.emit(on_change)
+        finally:
+            os.close(fd)
+
+    def read_events(self, fd, name):
+        hit = False
+        while True:
+            try:
+                data = os.read(fd, 65536)
+            except BlockingIOError:
+                return hit
+            offset = 0
+            while offset < len(data):
+                length = struct.unpack_from("iIII", data, offset)[3]
+                hit = hit or data[offset + 16:offset + 16 + length].rstrip(b"\0") == name
+                offset += 16 + length
+
+
+def create_file_watcher(path):
+    if sys.platform.startswith("linux"):
+        return InotifyFileWatcher(path)
+    return FileWatcher(path)
+
+def watch_config(app, watcher):
+    on_change = lambda: app.dispatcher.call(app.reload_config)
+    try:
+        watcher.run(on_change)
+    except Exception as e:
+        if type(watcher) is FileWatcher:
+            raise
+        print(f"Config watcher failed, falling back to polling: {e}")
+        fallback = FileWatcher(watcher.path)
+        fallback.stop_event = watcher.stop_event
+        fallback.run(on_change)
+
+
+# Decoded icons are kept in memory and as pre-sized PNGs next to the config.
+# Fallback images are only cached in memory so failures are retried next start.
+class IconCache:
+
+    def __init__(self, directory=ICON_CACHE_DIR, max_bytes=ICON_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory = {}
+        self.index = None
+        self.batching = 0
+        self.unsaved = False
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def key_for_path(path):
+        try:
+            st = os.stat(path)
+            stamp = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            stamp = "missing"
+        return f"exe:{os.path.normcase(os.path.abspath(path))}:{stamp}"
+
+    @staticmethod
+    def key_for_url(url):
+        return f"fav:{url_domain(url).lower()}"
+
+    def _filename(self, key):
+        import hashlib
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png"
+
+    def _load_index(self):
+        if self.index is None:
+            try:
+                with open(os.path.join(self.directory, ICON_CACHE_INDEX), "r") as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}
+        return self.index
+
+    def _save_index(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = os.path.join(self.directory, ICON_CACHE_INDEX + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(self.index, f)
+            os.replace(tmp, os.path.join(self.directory, ICON_CACHE_INDEX))
+        except OSError as e:
+            print(f"Icon cache error: {e}")
+
+    def _read_disk(self, key):
+        index = self._load_index()
+        entry = index.get(key)
+        if not entry:
+            return None
+        from PIL import Image
+        try:
+            with Image.open(os.path.join(self.directory, entry["file"])) as img:
+                image = img.convert("RGBA")
+        except (OSError, ValueError):
+            index.pop(key, None)
+            return None
+        entry["used"] = time.time()
         return image
-    except:
-        return Image.new("RGB", ICON_SIZE, color="gray")
 
-def overlay_launch_icon(base_image):
+    def _write_disk(self, key, image):
+        index = self._load_index()
+        name = self._filename(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, name)
+            image.save(path, format="PNG")
+            index[key] = {"file": name, "bytes": os.path.getsize(path), "used": time.time()}
+        except OSError as e:
+            print(f"Icon cache error: {e}")
+            return
+        if self.batching:
+            self.unsaved = True
+            return
+        self._evict()
+        self._save_index()
+
+    # Icons written inside a batch trim the cache and save index.json once,
+    # when the outermost batch ends, instead of after every icon.
+    @contextlib.contextmanager
+    def batch(self):
+        with self.lock:
+            self.batching += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batching -= 1
+                if not self.batching and self.unsaved:
+                    self.unsaved = False
+                    self._evict()
+                    self._save_index()
+
+    def _evict(self):
+        index = self._load_index()
+        total = sum(entry.get("bytes", 0) for entry in index.values())
+        for key, entry in sorted(index.items(), key=lambda kv: kv[1].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, entry["file"]))
+            except OSError:
+                pass
+            total -= entry.get("bytes", 0)
+            del index[key]
+            self.memory.pop(key, None)
+
+    def put(self, key, image):
+        with self.lock:
+            self.memory[key] = image
+            self._write_disk(key, image)
+
+    def peek(self, key):
+        with self.lock:
+            image = self.memory.get(key)
+            if image is None:
+                image = self._read_disk(key)
+                if image is not None:
+                    self.memory[key] = image
+            return image.copy() if image is not None else None
+
+    def get(self, key, loader, fallback):
+        image = self.peek(key)
+        if image is not None:
+            return image
+
+        try:
+            image = loader().convert("RGBA")
+            if image.size != ICON_SIZE:
+                image = image.resize(ICON_SIZE)
+            persist = True
+        except Exception:
+            image = fallback()
+            persist = False
+
+        with self.lock:
+            self.memory[key] = image
+            if persist:
+                self._write_disk(key, image)
+        return image.copy()
+
+
+icon_cache = IconCache()
+
+def url_domain(url):
+    return url.split("//")[-1].split("/")[0]
+
+# Platform backends keep OS-specific imports (pywin32, ctypes.windll, pystray)
+# out of module import. HeadlessPlatform is the stand-in used off Windows.
+class HeadlessPlatform:
+    name = "headless"
+    extracts_icons = False
+
+    def set_app_id(self, app_id):
+        pass
+
+    def make_window_rounded(self, window, width, height, radius=30):
+        pass
+
+    def spawn(self, path):
+        import subprocess
+        return subprocess.Popen([path])
+
+    def focus_process(self, pid):
+        return False
+
+    def close_process(self, proc):
+        proc.terminate()
+
+    def acquire_instance_lock(self):
+        import fcntl
+        lock = open(os.path.join(tempfile.gettempdir(), f"{INSTANCE_NAME}-{os.getuid()}.lock"), "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return None
+        return lock
+
+    def ipc_address(self):
+        return os.path.join(tempfile.gettempdir(), f"{INSTANCE_NAME}-{os.getuid()}.sock"), "AF_UNIX"
+
+    # ``menu`` is a callable returning entries, re-read on update_menu(). An
+    # entry is None (separator), (label, action[, default]) or (label, entries).
+    def create_tray(self, name, image, title, menu):
+        try:
+            import pystray
+        except Exception as e:
+            print(f"Tray unavailable: {e}")
+            return None
+
+        def build(entries):
+            items = []
+            for entry in entries:
+                if entry is None:
+                    items.append(pystray.Menu.SEPARATOR)
+                elif isinstance(entry[1], (list, tuple)):
+                    items.append(pystray.MenuItem(entry[0], pystray.Menu(*build(entry[1]))))
+                else:
+                    items.append(pystray.MenuItem(entry[0], entry[1], default=len(entry) > 2 and entry[2]))
+            return items
+
+        return pystray.Icon(name, image, title, pystray.Menu(lambda: build(menu())))
+
+
+class WindowsPlatform(HeadlessPlatform):
+    name = "windows"
+    extracts_icons = True
+
+    def extract_icon(self, path):
+        import win32gui
+        import win32ui
+        import win32con
+        from PIL import Image
+
+        large, small = win32gui.ExtractIconEx(path, 0)
+        try:
+            hicon = small[0] if small else large[0]
+            screen = win32gui.GetDC(0)
+            hdc = win32ui.CreateDCFromHandle(screen)
+            mem_dc = hdc.CreateCompatibleDC()
+            hbmp = win32ui.CreateBitmap()
+            hbmp.CreateCompatibleBitmap(hdc, ICON_SIZE[0], ICON_SIZE[1])
+            mem_dc.SelectObject(hbmp)
+            win32gui.DrawIconEx(mem_dc.GetHandleOutput(), 0, 0, hicon, ICON_SIZE[0], ICON_SIZE[1], 0, None, win32con.DI_NORMAL)
+            bmpinfo = hbmp.GetInfo()
+            bmpstr = hbmp.GetBitmapBits(True)
+            win32gui.DeleteObject(hbmp.GetHandle())
+            mem_dc.DeleteDC()
+            win32gui.ReleaseDC(0, screen)
+        finally:
+            for handle in list(large) + list(small):
+                win32gui.DestroyIcon(handle)
+        return Image.frombuffer('RGB', (bmpinfo['bmWidth'], bmpinfo['bmHeight']), bmpstr, 'raw', 'BGRX', 0, 1)
+
+    def set_app_id(self, app_id):
+        import ctypes
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+
+    def make_window_rounded(self, window, width, height, radius=30):
+        import ctypes
+        hwnd = ctypes.windll.user32.GetParent(window.winfo_id())
+        region = ctypes.windll.gdi32.CreateRoundRectRgn(0, 0, width, height, radius, radius)
+        ctypes.windll.user32.SetWindowRgn(hwnd, region, True)
+
+    def spawn(self, path):
+        import subprocess
+        if path.lower().endswith(".bat"):
+            return subprocess.Popen(["cmd.exe", "/c", path])
+        return subprocess.Popen(path)
+
+    def focus_process(self, pid):
+        import win32con
+        import win32gui
+        import win32process
+
+        windows = []
+        def collect(hwnd, _):
+            if (win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd)
+                    and win32process.GetWindowThreadProcessId(hwnd)[1] == pid):
+                windows.append(hwnd)
+            return True
+        win32gui.EnumWindows(collect, None)
+        if not windows:
+            return False
+        if win32gui.IsIconic(windows[0]):
+            win32gui.ShowWindow(windows[0], win32con.SW_RESTORE)
+        win32gui.SetForegroundWindow(windows[0])
+        return True
+
+    def close_process(self, proc):
+        # terminate() is TerminateProcess here, so ask the windows to close
+        # instead; windowless processes are left to the kill after a timeout.
+        import win32con
+        import win32gui
+        import win32process
+
+        def close(hwnd, _):
+            if win32gui.IsWindowVisible(hwnd) and win32process.GetWindowThreadProcessId(hwnd)[1] == proc.pid:
+                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+            return True
+        win32gui.EnumWindows(close, None)
+
+    def acquire_instance_lock(self):
+        import ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.CreateMutexW(None, False, f"Local\\{INSTANCE_NAME}")
+        if not handle or ctypes.get_last_error() == 183:  # ERROR_ALREADY_EXISTS
+            if handle:
+                kernel32.CloseHandle(handle)
+            return None
+        return handle
+
+    def ipc_address(self):
+        return f"\\\\.\\pipe\\{INSTANCE_NAME}-{os.environ.get('USERNAME', 'user')}", "AF_PIPE"
+
+
+_platform = None
+
+def get_platform():
+    global _platform
+    if _platform is None:
+        _platform = WindowsPlatform() if sys.platform == "win32" else HeadlessPlatform()
+    return _platform
+
+def _pe_resource_layout(data):
+    if data[:2] != b"MZ":
+        raise ValueError("not a PE file")
+    pe = struct.unpack_from("<I", data, 0x3C)[0]
+    if data[pe:pe + 4] != b"PE\0\0":
+        raise ValueError("not a PE file")
+    section_count, = struct.unpack_from("<H", data, pe + 6)
+    optional_size, = struct.unpack_from("<H", data, pe + 20)
+    optional = pe + 24
+    magic, = struct.unpack_from("<H", data, optional)
+    directories = optional + (112 if magic == 0x20b else 96)
+    directory_count, = struct.unpack_from("<I", data, directories - 4)
+    if directory_count <= 2:
+        raise ValueError("no resource directory")
+    resource_rva, = struct.unpack_from("<I", data, directories + 16)
+    if not resource_rva:
+        raise ValueError("no resource directory")
+
+    sections = []
+    table = optional + optional_size
+    for i in range(section_count):
+        virtual_size, virtual_address, raw_size, raw_pointer = struct.unpack_from("<IIII", data, table + i * 40 + 8)
+        sections.append((virtual_address, max(virtual_size, raw_size), raw_pointer))
+
+    def rva_to_offset(rva):
+        for virtual_address, size, raw_pointer in sections:
+            if virtual_address <= rva < virtual_address + size:
+                return rva - virtual_address + raw_pointer
+        raise ValueError(f"RVA {rva:#x} is outside every section")
+
+    return rva_to_offset(resource_rva), rva_to_offset
+
+def _pe_resource_entries(data, base, offset):
+    named, ids = struct.unpack_from("<HH", data, base + offset + 12)
+    entries = []
+    for i in range(named + ids):
+        name, target = struct.unpack_from("<II", data, base + offset + 16 + i * 8)
+        entries.append((None if name & 0x80000000 else name, target))
+    return entries
+
+def _pe_resource_leaf(data, base, target, rva_to_offset):
+    # Descend through the name and language levels, taking the first entry.
+    for _ in range(3):
+        if not target & 0x80000000:
+            rva, size = struct.unpack_from("<II", data, base + target)
+            offset = rva_to_offset(rva)
+            return data[offset:offset + size]
+        entries = _pe_resource_entries(data, base, target & 0x7FFFFFFF)
+        if not entries:
+            break
+        target = entries[0][1]
+    raise ValueError("malformed resource directory")
+
+def _pe_icon_bytes(data, size):
+    base, rva_to_offset = _pe_resource_layout(data)
+    types = dict(_pe_resource_entries(data, base, 0))
+    if RT_GROUP_ICON not in types or RT_ICON not in types:
+        raise ValueError("no icon resources")
+
+    groups = _pe_resource_entries(data, base, types[RT_GROUP_ICON] & 0x7FFFFFFF)
+    group = _pe_resource_leaf(data, base, groups[0][1], rva_to_offset)
+    icons = {name: target for name, target in _pe_resource_entries(data, base, types[RT_ICON] & 0x7FFFFFFF)}
+
+    candidates = []
+    count, = struct.unpack_from("<H", group, 4)
+    for i in range(count):
+        width, height, colors, _, planes, bit_count, _, icon_id = struct.unpack_from("<BBBBHHIH", group, 6 + i * 14)
+        if icon_id in icons:
+            candidates.append((width or 256, height or 256, colors, planes, bit_count, icon_id))
+    if not candidates:
+        raise ValueError("icon group has no images")
+
+    # Smallest image at least as large as requested, deepest colour first.
+    width, height, colors, planes, bit_count, icon_id = min(
+        candidates, key=lambda c: (c[0] < size, abs(c[0] - size), -c[4]))
+    image = _pe_resource_leaf(data, base, icons[icon_id], rva_to_offset)
+    header = struct.pack("<HHH", 0, 1, 1)
+    entry = struct.pack("<BBBBHHII", width % 256, height % 256, colors, 0, planes, bit_count, len(image), 22)
+    return header + entry + image
+
+def read_pe_icon(path, size=ICON_SIZE):
+    import mmap
+    from PIL import Image
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        ico = _pe_icon_bytes(data, size[0])
+    with Image.open(io.BytesIO(ico)) as img:
+        return img.convert("RGBA").resize(size, Image.LANCZOS)
+
+def _extract_icon(path):
+    # The GDI fallback only exists on Windows; elsewhere a PE without a
+    # usable icon gets the cache's fallback image.
+    platform = get_platform()
+    if not platform.extracts_icons:
+        return read_pe_icon(path)
     try:
-        overlay = Image.open(OVERLAY_ICON_PATH).resize((16, 16))
+        return read_pe_icon(path)
+    except Exception:
+        return platform.extract_icon(path)
+
+def extract_icons(paths, progress=None):
+    # Only cache misses are parsed, in one batch so index.json is saved once.
+    # Parsing is a fraction of each miss next to the PNG write, so a process
+    # pool was slower at every batch size benchmark.py tried, even with fork.
+    # progress() is called per icon.
+    misses = [path for path in dict.fromkeys(paths) if icon_cache.peek(IconCache.key_for_path(path)) is None]
+    with icon_cache.batch():
+        for path in misses:
+            extract_icon(path)
+            if progress:
+                progress()
+
+@traced("extract_icon")
+def extract_icon(path):
+    from PIL import Image
+    return icon_cache.get(IconCache.key_for_path(path), lambda: _extract_icon(path),
+                          lambda: Image.new("RGBA", ICON_SIZE, color="gray"))
+
+_launch_overlay = None
+
+def launch_overlay():
+    global _launch_overlay
+    if _launch_overlay is None:
+        from PIL import Image
+        try:
+            _launch_overlay = Image.open(OVERLAY_ICON_PATH).convert("RGBA").resize((16, 16))
+        except:
+            _launch_overlay = False
+    return _launch_overlay
+
+def overlay_launch_icon(base_image):
+    overlay = launch_overlay()
+    if overlay:
         base_image.paste(overlay, (ICON_SIZE[0] - 18, 2), overlay)
-    except:
-        pass
     return base_image
 
-def fetch_favicon(url):
-    domain = url.split("//")[-1].split("/")[0]
-    favicon_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=64"
+
+# Shares one PhotoImage per (icon key, variant) between cells and refreshes.
+# Evicting only drops the pool's reference; cells keep theirs alive.
+class PhotoImagePool:
+    def __init__(self, max_size=PHOTO_POOL_SIZE):
+        self.max_size = max_size
+        self.images = OrderedDict()
+
+    def get(self, key, render):
+        photo = self.images.get(key)
+        if photo is not None:
+            self.images.move_to_end(key)
+            return photo
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(render())
+        self.images[key] = photo
+        while len(self.images) > self.max_size:
+            self.images.popitem(last=False)
+        return photo
+
+def default_site_icon():
+    from PIL import Image
     try:
-        with urllib.request.urlopen(favicon_url) as response:
-            icon_data = response.read()
-            image = Image.open(io.BytesIO(icon_data)).resize(ICON_SIZE)
-            return image
+        return Image.open("images/Coriolis.png").convert("RGBA").resize(ICON_SIZE)
     except:
+        return Image.new("RGBA", ICON_SIZE, color="gray")
+
+def _fetch_favicon(url):
+    import urllib.request
+    from PIL import Image
+    favicon_url = FAVICON_URL.format(domain=url_domain(url))
+    with urllib.request.urlopen(favicon_url, timeout=FAVICON_TIMEOUT) as response:
+        icon_data = response.read()
+    return Image.open(io.BytesIO(icon_data)).resize(ICON_SIZE)
+
+@traced("fetch_favicon")
+def fetch_favicon(url):
+    return icon_cache.get(IconCache.key_for_url(url), lambda: _fetch_favicon(url), default_site_icon)
+
+def cached_favicon(url):
+    return icon_cache.peek(IconCache.key_for_url(url))
+
+_placeholder = None
+
+def placeholder_icon():
+    global _placeholder
+    if _placeholder is None:
+        _placeholder = default_site_icon()
+    return _placeholder.copy()
+
+
+# Runs slow icon lookups on a small worker pool. Finished images are queued and
+# handed to their callbacks from the Tk thread, which polls with after().
+class IconLoader:
+    def __init__(self, root, fetch, peek, workers=FAVICON_WORKERS):
+        self.root = root
+        self.fetch = fetch
+        self.peek = peek
+        self.workers = workers
+        self.executor = None
+        self.pending = {}
+        self.results = queue.Queue()
+        self.polling = False
+
+    def request(self, source, callback):
+        image = self.peek(source)
+        if image is not None:
+            return image
+
+        if source in self.pending:
+            self.pending[source][1].append(callback)
+        else:
+            if self.executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="icon")
+            future = self.executor.submit(self._run, source)
+            self.pending[source] = (future, [callback])
+        self._schedule()
+        return None
+
+    def _run(self, source):
         try:
-            return Image.open("images/Coriolis.png").resize(ICON_SIZE)
-        except:
-            return Image.new("RGB", ICON_SIZE, color="gray")
-
-def monitor_edlauncher(app):
-    seen = False
-    while True:
-        found = any(proc.name().lower() == ED_LAUNCHER_NAME.lower() for proc in psutil.process_iter(['name']))
-        if found and not seen:
-            seen = True
-            for item in app.data.get("apps", []):
-                if item.get("launch_with_ed"):
-                    try:
-                        path = item.get("path")
-                        if path.lower().endswith(".bat"):
-                            subprocess.Popen(["cmd.exe", "/c", path])
-                        else:
-                            subprocess.Popen(path)
-                    except Exception as e:
-                        print(f"Failed to auto-launch app: {e}")
-        elif not found:
-            seen = False
-        time.sleep(5)
+            image = self.fetch(source)
+        except Exception as e:
+            print(f"Icon load failed for {source}: {e}")
+            image = None
+        self.results.put((source, image))
+
+    def _schedule(self):
+        if not self.polling:
+            self.polling = True
+            self.root.after(ICON_POLL_MS, self._poll)
+
+    def _poll(self):
+        self.polling = False
+        while True:
+            try:
+                source, image = self.results.get_nowait()
+            except queue.Empty:
+                break
+            entry = self.pending.pop(source, None)
+            if entry and image is not None:
+                for callback in entry[1]:
+                    callback(image.copy())
+        if self.pending:
+            self._schedule()
+
+    def cancel(self, keep=()):
+        for source in [s for s in self.pending if s not in keep]:
+            self.pending.pop(source)[0].cancel()
+
+    def shutdown(self):
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+# Process watchers report process starts and exits to two callbacks,
+# on_start(pid, name) and on_exit(pid, name). Processes already running when
+# the watcher starts are reported as starts on the first pass.
+class ProcessWatcher:
+    def __init__(self):
+        self.stop_event = threading.Event()
+
+    def run(self, on_start, on_exit):
+        raise NotImplementedError
+
+    def stop(self):
+        self.stop_event.set()
+
+    def emit(self, callback, pid, name):
+        try:
+            callback(pid, name)
+        except Exception as e:
+            print(f"Process watcher callback failed: {e}")
+
+
+# Diffs the PID list between passes and only looks up names for new PIDs.
+# The interval backs off while nothing changes and snaps back on activity.
+class PollingWatcher(ProcessWatcher):
+    def __init__(self, min_interval=WATCH_MIN_INTERVAL, max_interval=WATCH_MAX_INTERVAL):
+        super().__init__()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def list_pids(self):
+        import psutil
+        return psutil.pids()
+
+    def process_name(self, pid):
+        import psutil
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    # PIDs whose name can't be read are remembered as None, so they are not
+    # looked up again on every pass and don't count as activity.
+    @traced("watcher.poll")
+    def poll(self, known, on_start, on_exit):
+        pids = set(self.list_pids())
+        active = False
+        for pid in set(known).difference(pids):
+            name = known.pop(pid)
+            if name is not None:
+                self.emit(on_exit, pid, name)
+                active = True
+        for pid in pids.difference(known):
+            name = known[pid] = self.process_name(pid)
+            if name is not None:
+                self.emit(on_start, pid, name)
+                active = True
+        return active
+
+    def run(self, on_start, on_exit):
+        known = {}
+        interval = self.min_interval
+        while not self.stop_event.is_set():
+            if self.poll(known, on_start, on_exit):
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+            self.stop_event.wait(interval)
+
+
+# Linux backend reading /proc directly. Names come from the executable in the
+# command line so Wine/Proton processes show up as "EDLaunch.exe".
+class ProcfsWatcher(PollingWatcher):
+    def list_pids(self):
+        return [int(entry) for entry in os.listdir("/proc") if entry.isdigit()]
+
+    def process_name(self, pid):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv0 = f.read().split(b"\0", 1)[0].decode("utf-8", "replace")
+            if argv0:
+                return argv0.replace("\\", "/").rsplit("/", 1)[-1]
+            with open(f"/proc/{pid}/comm", "r") as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+
+# Windows backend subscribing to WMI process creation and deletion events, so
+# nothing is scanned while the system is idle.
+class WmiWatcher(ProcessWatcher):
+    TIMED_OUT = 0x80043001  # wbemErrTimedOut from NextEvent
+    QUERY = ("SELECT * FROM __InstanceOperationEvent WITHIN 1 WHERE TargetInstance ISA 'Win32_Process' "
+             "AND (__CLASS = '__InstanceCreationEvent' OR __CLASS = '__InstanceDeletionEvent')")
+
+    def run(self, on_start, on_exit):
+        import pythoncom
+        import pywintypes
+        import win32com.client
+
+        pythoncom.CoInitialize()
+        try:
+            wmi = win32com.client.GetObject("winmgmts:")
+            events = wmi.ExecNotificationQuery(self.QUERY)
+            for proc in wmi.InstancesOf("Win32_Process"):
+                self.emit(on_start, proc.ProcessId, proc.Name)
+            while not self.stop_event.is_set():
+                try:
+                    event = events.NextEvent(1000)
+                except pywintypes.com_error as e:
+                    # Only the timeout is expected; anything else (service
+                    # stopped, access denied) ends the watcher so
+                    # monitor_processes falls back to polling.
+                    code = e.excepinfo[5] if e.excepinfo else e.hresult
+                    if code & 0xFFFFFFFF == self.TIMED_OUT:
+                        continue
+                    raise
+                target = event.TargetInstance
+                with tracer.span("watcher.event"):
+                    if event.Path_.Class == "__InstanceCreationEvent":
+                        self.emit(on_start, target.ProcessId, target.Name)
+                    else:
+                        self.emit(on_exit, target.ProcessId, target.Name)
+        finally:
+            pythoncom.CoUninitialize()
+
+
+def create_process_watcher():
+    if sys.platform == "win32":
+        try:
+            import win32com.client
+            return WmiWatcher()
+        except ImportError:
+            pass
+    elif sys.platform.startswith("linux") and os.path.isdir("/proc"):
+        return ProcfsWatcher()
+    return PollingWatcher()
+
+@traced("spawn_app")
+def spawn_app(path):
+    return get_platform().spawn(path)
+
+def running_process_snapshot():
+    import psutil
+    return {os.path.normcase(proc.info["exe"]) for proc in psutil.process_iter(["exe"]) if proc.info.get("exe")}
+
+def is_app_running(path, snapshot):
+    # Only the full executable path counts; another program with the same
+    # file name elsewhere on the system doesn't.
+    return app_key(path) in snapshot
+
+def launch_number(item, key):
+    value = item.get(key)
+    if value is None:
+        return 0.0
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = None
+    if value is None or not -1e9 < value < 1e9:  # also rejects nan and inf
+        print(f"Ignoring {key} {item.get(key)!r} for '{entry_name(item, 'apps')}'")
+        return 0.0
+    return value
+
+
+# Starts a set of apps. Apps are ordered by their optional "launch_order",
+# wait for the apps in the set named in "launch_after" and an optional
+# "launch_delay" in seconds, and otherwise spawn concurrently. An app is only
+# handed to a worker once its dependencies have finished and its delay has
+# passed on a timer, so waiting never holds a worker. Apps that are already
+# running in a single process snapshot are skipped.
+class AutoLaunchOrchestrator:
+    def __init__(self, spawn=spawn_app, snapshot=running_process_snapshot, workers=AUTO_LAUNCH_WORKERS):
+        self.spawn = spawn
+        self.snapshot = snapshot
+        self.workers = workers
+
+    def plan(self, apps):
+        auto = [item for item in apps if item.get("path")]
+        order = {id(item): launch_number(item, "launch_order") for item in auto}
+        auto.sort(key=lambda item: order[id(item)])
+        deps = {}
+        for item in auto:
+            after = item.get("launch_after") or []
+            if isinstance(after, str):
+                after = [after]
+            found = [resolve_entry(auto, name, "apps") for name in after if isinstance(name, str)]
+            deps[id(item)] = list({id(dep): dep for dep in found if dep is not None and dep is not item}.values())
+
+        # Topological order; anything left in a cycle loses its dependencies.
+        ordered, placed = [], set()
+        while len(ordered) < len(auto):
+            ready = [item for item in auto if id(item) not in placed
+                     and all(id(dep) in placed for dep in deps[id(item)])]
+            if not ready:
+                ready = [item for item in auto if id(item) not in placed][:1]
+                print(f"Dependency cycle at '{entry_name(ready[0], 'apps')}', ignoring its launch_after")
+                deps[id(ready[0])] = [dep for dep in deps[id(ready[0])] if id(dep) in placed]
+            for item in ready:
+                ordered.append(item)
+                placed.add(id(item))
+        return [(item, deps[id(item)]) for item in ordered]
+
+    def run(self, apps):
+        plan = self.plan(apps)
+        if not plan:
+            return []
+        started = time.perf_counter()
+        try:
+            snapshot = self.snapshot()
+        except Exception as e:
+            print(f"Process snapshot failed: {e}")
+            snapshot = set()
+
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="autolaunch")
+        lock = threading.Lock()
+        finished = threading.Event()
+        results = {}
+        waiting = {id(item): len(deps) for item, deps in plan}
+        dependents = {}
+        for item, deps in plan:
+            for dep in deps:
+                dependents.setdefault(id(dep), []).append(item)
+
+        def ready(item):
+            delay = launch_number(item, "launch_delay")
+            if delay > 0:
+                timer = threading.Timer(delay, pool.submit, (launch, item))
+                timer.daemon = True
+                timer.start()
+            else:
+                pool.submit(launch, item)
+
+        def launch(item):
+            try:
+                result = self._launch(item, snapshot, started)
+            except Exception as e:
+                print(f"Failed to auto-launch app: {e}")
+                result = {"name": entry_name(item, "apps"), "path": item["path"], "status": "failed", "latency": 0.0}
+            unblocked = []
+            with lock:
+                results[id(item)] = result
+                for dependent in dependents.get(id(item), ()):
+                    waiting[id(dependent)] -= 1
+                    if not waiting[id(dependent)]:
+                        unblocked.append(dependent)
+                done = len(results) == len(plan)
+            for dependent in unblocked:
+                ready(dependent)
+            if done:
+                finished.set()
+
+        for item, deps in plan:
+            if not deps:
+                ready(item)
+        finished.wait()
+        pool.shutdown()
+        return [results[id(item)] for item, _ in plan]
+
+    def _launch(self, item, snapshot, started):
+        result = {"name": entry_name(item, "apps"), "path": item["path"]}
+        if is_app_running(item["path"], snapshot):
+            result.update(status="running", latency=0.0)
+            return result
+        spawn_started = time.perf_counter()
+        try:
+            self.spawn(item["path"])
+            result["status"] = "launched"
+        except Exception as e:
+            print(f"Failed to auto-launch app: {e}")
+            result["status"] = "failed"
+        result["latency"] = time.perf_counter() - spawn_started
+        result["started_at"] = spawn_started - started
+        return result
+
+@traced("auto_launch")
+def auto_launch_apps(app, items=None):
+    if items is None:
+        items = [item for item in app.data.get("apps", []) if item.get("launch_with_ed")]
+    app.last_auto_launch = AutoLaunchOrchestrator().run(items)
+
+def warm_app_icons(data):
+    extract_icons([item["path"] for item in data.get("apps", []) if item.get("path")])
+
+def process_cmdline(pid):
+    if os.path.isdir("/proc"):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                return f.read().replace(b"\0", b" ").decode("utf-8", "replace")
+        except OSError:
+            return ""
+    import psutil
+    try:
+        return " ".join(psutil.Process(pid).cmdline())
+    except psutil.Error:
+        return ""
+
+# Closes the processes running the given app paths: those whose executable is
+# one of the paths, plus any the sampler tracks for them (our own launches).
+# Each is first asked to close through the platform, and only killed if it is
+# still running after the timeout.
+def close_apps(paths, sampler=None, timeout=TRIGGER_CLOSE_TIMEOUT):
+    import psutil
+    keys = {app_key(path) for path in paths}
+    procs = {proc.pid: proc for proc in psutil.process_iter(["exe"])
+             if proc.info.get("exe") and os.path.normcase(proc.info["exe"]) in keys}
+    if sampler is not None:
+        for key, proc in list(sampler.procs.values()):
+            if key in keys:
+                procs.setdefault(proc.pid, proc)
+    procs.pop(os.getpid(), None)
+    procs = list(procs.values())
+    platform = get_platform()
+    for proc in procs:
+        try:
+            platform.close_process(proc)
+        except psutil.NoSuchProcess:
+            pass
+        except Exception as e:
+            print(f"Could not close process {proc.pid}: {e}")
+    _, alive = psutil.wait_procs(procs, timeout=timeout)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.Error:
+            pass
+    return len(procs)
+
+# Trigger rules come from the "triggers" list in data.edl, plus a built-in
+# rule that starts the "launch_with_ed" apps with EDLaunch.exe unless a user
+# rule already starts or stops those apps. A rule names
+# a "process", optionally a "match" text (or list) its command line must
+# contain, such as the Odyssey or Horizons install folder, and the apps to
+# "start" when the first matching process appears and to "stop" when the last
+# one exits. "start"/"stop" are app names, or "launch_with_ed" for the apps
+# marked to launch with Elite Dangerous.
+def trigger_rules(data):
+    rules = []
+    for rule in data.get("triggers", []):
+        if isinstance(rule, dict) and isinstance(rule.get("process"), str) and rule["process"]:
+            rules.append(rule)
+        else:
+            print(f"Ignoring trigger without a process name: {rule}")
+    if not any("launch_with_ed" in (rule.get("start"), rule.get("stop")) for rule in rules):
+        rules.insert(0, {"name": "Launch with Elite Dangerous", "process": ED_LAUNCHER_NAME, "start": "launch_with_ed"})
+    return rules
+
+def trigger_name(rule):
+    return rule.get("name") or rule["process"]
+
+
+# Matches process start and exit events against the trigger rules. Rules are
+# indexed by lower-cased executable name, so each event costs one dict lookup
+# however many rules there are, and command lines are only read for processes
+# a rule names. Events come from a ProcessWatcher, which takes one snapshot
+# per poll, or can be fed directly: engine.on_start(4242, "EliteDangerous64.exe").
+class TriggerEngine:
+    def __init__(self, rules, on_fire, cmdline=process_cmdline):
+        self.on_fire = on_fire
+        self.cmdline = cmdline
+        self.lock = threading.Lock()
+        self.running = {}
+        self.cmdlines = {}
+        self.index = {}
+        self.active = {}
+        self.set_rules(rules)
+
+    def set_rules(self, rules):
+        index = {}
+        for rule in rules:
+            index.setdefault(rule["process"].casefold(), []).append(rule)
+        with self.lock:
+            # Rules whose process is already running start out active, so a
+            # reload never fires them, but their stop still does.
+            self.index = index
+            self.active = {}
+            for name, named_rules in index.items():
+                for pid in self.running.get(name, ()):
+                    for rule in named_rules:
+                        if self.matches(rule, pid):
+                            self.active.setdefault(id(rule), set()).add(pid)
+
+    def reset(self):
+        with self.lock:
+            self.running.clear()
+            self.cmdlines.clear()
+            self.active.clear()
+
+    def matches(self, rule, pid):
+        match = rule.get("match")
+        if not match:
+            return True
+        if pid not in self.cmdlines:
+            self.cmdlines[pid] = self.cmdline(pid).replace("\\", "/").casefold()
+        texts = [match] if isinstance(match, str) else match
+        return any(text.replace("\\", "/").casefold() in self.cmdlines[pid] for text in texts)
+
+    def on_start(self, pid, name):
+        key = name.casefold()
+        fired = []
+        with self.lock:
+            self.running.setdefault(key, set()).add(pid)
+            for rule in self.index.get(key, ()):
+                if self.matches(rule, pid):
+                    pids = self.active.setdefault(id(rule), set())
+                    if not pids:
+                        fired.append(rule)
+                    pids.add(pid)
+        for rule in fired:
+            self.fire(rule, "start")
+
+    def on_exit(self, pid, name):
+        key = name.casefold()
+        fired = []
+        with self.lock:
+            pids = self.running.get(key)
+            if pids is not None:
+                pids.discard(pid)
+                if not pids:
+                    del self.running[key]
+            self.cmdlines.pop(pid, None)
+            for rule in self.index.get(key, ()):
+                pids = self.active.get(id(rule))
+                if pids and pid in pids:
+                    pids.discard(pid)
+                    if not pids:
+                        fired.append(rule)
+        for rule in fired:
+            self.fire(rule, "stop")
+
+    def fire(self, rule, event):
+        if rule.get(event):
+            try:
+                self.on_fire(rule, event)
+            except Exception as e:
+                print(f"Trigger '{trigger_name(rule)}' failed: {e}")
+
+
+@traced("trigger")
+def run_trigger(app, rule, event):
+    apps = list(app.data.get("apps", []))
+    names = rule[event]
+    if names == "launch_with_ed":
+        items = [item for item in apps if item.get("launch_with_ed")]
+    else:
+        items = []
+        for name in [names] if isinstance(names, str) else names:
+            item = resolve_entry(apps, name, "apps")
+            if item is None:
+                print(f"Trigger '{trigger_name(rule)}': no app named '{name}'")
+            else:
+                items.append(item)
+    if not items:
+        return
+    if event == "start":
+        auto_launch_apps(app, items)
+    else:
+        close_apps([item["path"] for item in items if item.get("path")], app.sampler)
+
+def monitor_processes(app, watcher=None):
+    # One process watcher feeds both the trigger rules and the sampler.
+    def on_start(pid, name):
+        app.sampler.on_process_start(pid, name)
+        app.triggers.on_start(pid, name)
+
+    def on_exit(pid, name):
+        app.sampler.on_process_exit(pid, name)
+        app.triggers.on_exit(pid, name)
+
+    watcher = watcher or create_process_watcher()
+    try:
+        watcher.run(on_start, on_exit)
+    except Exception as e:
+        if type(watcher) is PollingWatcher:
+            raise
+        print(f"Process watcher failed, falling back to polling: {e}")
+        app.triggers.reset()
+        app.sampler.reset()
+        PollingWatcher().run(on_start, on_exit)
+
+def app_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+def format_usage(usage):
+    count = len(usage["pids"])
+    processes = f" in {count} processes" if count > 1 else ""
+    return f"CPU {usage['cpu']:.1f}%  RAM {usage['rss'] / 1048576:.0f} MB{processes}"
+
+
+# Samples CPU and memory of running apps on one background thread. PIDs come
+# from our own launches (track) and from the process watcher's start/exit
+# events: a started process whose name matches a watched app is confirmed by
+# its executable path on the next tick, so the sampler never scans the process
+# table itself. Ticks read just the known PIDs, each inside psutil's
+# oneshot(). The interval backs off while nothing is running and is stretched
+# so sampling stays under SAMPLE_BUDGET of wall time. on_change() fires when
+# the set of running apps changes, and the thread sleeps entirely while paused.
+class ProcessSampler:
+    def __init__(self, on_change=None, min_interval=SAMPLE_MIN_INTERVAL, max_interval=SAMPLE_MAX_INTERVAL,
+                 budget=SAMPLE_BUDGET):
+        self.on_change = on_change
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.budget = budget
+        self.interval = min_interval
+        self.paths = {}
+        self.names = set()
+        self.running = {}
+        self.pending = []
+        self.procs = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.active = threading.Event()
+        self.active.set()
+        self.stop_event = threading.Event()
+        self.started_at = time.perf_counter()
+        self.ticks = 0
+        self.busy_seconds = 0.0
+
+    def start(self):
+        threading.Thread(target=self.run, name="sampler", daemon=True).start()
+
+    def watch(self, paths):
+        with self.lock:
+            self.paths = {app_key(path): path for path in paths if path}
+            names = {os.path.basename(key).casefold() for key in self.paths}
+            added, self.names = names - self.names, names
+            # Already-running processes under a newly watched name.
+            self.pending.extend((None, pid) for name in added for pid in self.running.get(name, ()))
+        self.wake.set()
+
+    def track(self, path, pid):
+        with self.lock:
+            self.pending.append((app_key(path), pid))
+        self.wake.set()
+
+    def on_process_start(self, pid, name):
+        key = name.casefold()
+        with self.lock:
+            self.running.setdefault(key, set()).add(pid)
+            if key not in self.names:
+                return
+            self.pending.append((None, pid))
+        self.wake.set()
+
+    def on_process_exit(self, pid, name):
+        key = name.casefold()
+        with self.lock:
+            pids = self.running.get(key)
+            if pids is not None:
+                pids.discard(pid)
+                if not pids:
+                    del self.running[key]
+        if pid in self.procs:
+            self.wake.set()
+
+    def reset(self):
+        with self.lock:
+            self.running.clear()
+
+    def pause(self):
+        self.active.clear()
+
+    def resume(self):
+        self.active.set()
+        self.wake.set()
+
+    def stop(self):
+        self.stop_event.set()
+        self.active.set()
+        self.wake.set()
+
+    def usage(self, path):
+        return self.stats.get(app_key(path))
+
+    def is_running(self, path):
+        return app_key(path) in self.stats
+
+    def overhead(self):
+        elapsed = time.perf_counter() - self.started_at
+        return self.busy_seconds / elapsed if elapsed > 0 else 0.0
+
+    @traced("sampler.tick")
+    def tick(self):
+        import psutil
+        with self.lock:
+            pending, self.pending = self.pending, []
+            paths = self.paths
+        for key, pid in pending:
+            if pid in self.procs:
+                continue
+            try:
+                proc = psutil.Process(pid)
+                if key is None:
+                    key = os.path.normcase(proc.exe())
+            except psutil.Error:
+                continue
+            if key in paths:
+                self.procs[pid] = (key, proc)
+
+        cpus = psutil.cpu_count() or 1
+        stats = {}
+        for pid, (key, proc) in list(self.procs.items()):
+            if key not in paths:
+                del self.procs[pid]
+                continue
+            try:
+                with proc.oneshot():
+                    if not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE:
+                        raise psutil.NoSuchProcess(pid)
+                    cpu = proc.cpu_percent(None) / cpus
+                    rss = proc.memory_info().rss
+            except psutil.Error:
+                del self.procs[pid]
+                continue
+            usage = stats.setdefault(key, {"pids": [], "cpu": 0.0, "rss": 0})
+            usage["pids"].append(pid)
+            usage["cpu"] += cpu
+            usage["rss"] += rss
+
+        changed = stats.keys() != self.stats.keys()
+        self.stats = stats
+        if changed and self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                print(f"Sampler callback failed: {e}")
+        return changed
+
+    def run(self):
+        try:
+            import psutil
+        except ImportError as e:
+            print(f"Process sampling unavailable: {e}")
+            return
+        while not self.stop_event.is_set():
+            self.active.wait()
+            if self.stop_event.is_set():
+                break
+            self.wake.clear()
+            started = time.perf_counter()
+            try:
+                changed = self.tick()
+            except Exception as e:
+                print(f"Process sampling failed: {e}")
+                changed = False
+            cost = time.perf_counter() - started
+            self.ticks += 1
+            self.busy_seconds += cost
+            if changed or self.stats:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+            self.wake.wait(max(self.interval, cost / self.budget))
+
+    def terminate(self, path, timeout=3):
+        # Runs off the Tk thread; processes that ignore terminate are killed.
+        def end():
+            import psutil
+            procs = [proc for key, proc in list(self.procs.values()) if key == app_key(path)]
+            for proc in procs:
+                try:
+                    proc.terminate()
+                except psutil.Error:
+                    pass
+            _, alive = psutil.wait_procs(procs, timeout=timeout)
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.Error:
+                    pass
+            self.wake.set()
+        threading.Thread(target=end, name="terminate", daemon=True).start()
+
+
+def url_key(url):
+    from urllib.parse import urlsplit
+    url = url.strip()
+    try:
+        parts = urlsplit(url if "//" in url else "//" + url)
+        port = parts.port
+    except ValueError:
+        return url.lower().rstrip("/")
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    port = f":{port}" if port and port not in (80, 443) else ""
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{host}{port}{parts.path.rstrip('/')}{query}"
+
+def entry_key(item, type_):
+    if type_ == "apps":
+        return app_key(item["path"]) if item.get("path") else None
+    return url_key(item["url"]) if item.get("url") else None
+
+# Returns the entries of ``new`` not already in ``existing`` (or earlier in
+# ``new``), compared by normalized path or URL. Existing entries always win.
+def merge_entries(existing, new, type_):
+    seen = {entry_key(item, type_) for item in existing}
+    added = []
+    for item in new:
+        key = entry_key(item, type_)
+        if key is not None and key not in seen:
+            seen.add(key)
+            added.append(item)
+    return added
+
+def scan_apps(directory, limit=IMPORT_SCAN_LIMIT):
+    apps = []
+    for folder, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith((".", "$")))
+        for name in sorted(files):
+            if name.lower().endswith((".exe", ".bat")) and not IMPORT_SKIP.search(name):
+                apps.append({"path": os.path.join(folder, name).replace("\\", "/"), "launch_with_ed": False})
+                if len(apps) >= limit:
+                    print(f"Stopped scanning {directory} after {limit} apps")
+                    return apps
+    return apps
+
+
+def _bookmark_links(node, links):
+    # Chrome's Bookmarks file uses url/name, Firefox's JSON backups uri/title.
+    if isinstance(node, dict):
+        url = node.get("url") or node.get("uri")
+        if isinstance(url, str):
+            links.append((url, node.get("name") or node.get("title") or ""))
+        for value in node.values():
+            _bookmark_links(value, links)
+    elif isinstance(node, list):
+        for value in node:
+            _bookmark_links(value, links)
+    return links
+
+# Reads a browser bookmarks export: the Netscape HTML format every browser
+# exports, or a Chrome/Firefox JSON file.
+def read_bookmarks(path):
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    if text.lstrip().startswith(("{", "[")):
+        links = _bookmark_links(json.loads(text), [])
+    else:
+        from html.parser import HTMLParser
+
+        class BookmarkParser(HTMLParser):
+            def __init__(self):
+                super().__init__()
+                self.links = []
+                self.href = None
+                self.text = []
+
+            def handle_starttag(self, tag, attrs):
+                if tag == "a":
+                    self.href = dict(attrs).get("href")
+                    self.text = []
+
+            def handle_data(self, data):
+                if self.href is not None:
+                    self.text.append(data)
+
+            def handle_endtag(self, tag):
+                if tag == "a" and self.href is not None:
+                    self.links.append((self.href, "".join(self.text).strip()))
+                    self.href = None
+
+        parser = BookmarkParser()
+        parser.feed(text)
+        links = parser.links
+    websites = []
+    for url, title in links:
+        if url.lower().startswith(("http://", "https://")):
+            item = {"url": url}
+            if title and title != url:
+                item["custom_name"] = title
+            websites.append(item)
+    return websites
+
+def read_edl(path):
+    with open(path, "r") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("not a launcher config")
+    lists = [data.get(key) if isinstance(data.get(key), list) else [] for key in ("apps", "websites")]
+    apps = [item for item in lists[0] if isinstance(item, dict) and isinstance(item.get("path"), str) and item["path"]]
+    websites = [item for item in lists[1] if isinstance(item, dict) and isinstance(item.get("url"), str) and item["url"]]
+    return apps, websites
+
+# Fills the icon cache for imported entries before they are shown: exe icons
+# through extract_icons and favicons, one per domain, on a thread
+# pool at the same time. progress(done, total) is called from worker threads.
+@traced("warm_icons")
+def warm_icons(paths, urls, progress=None):
+    urls = {IconCache.key_for_url(url): url for url in urls}
+    urls = [url for key, url in urls.items() if icon_cache.peek(key) is None]
+    paths = [path for path in dict.fromkeys(paths) if icon_cache.peek(IconCache.key_for_path(path)) is None]
+    total = len(paths) + len(urls)
+    done = [0]
+    lock = threading.Lock()
+
+    def step(*_):
+        with lock:
+            done[0] += 1
+            count = done[0]
+        if progress:
+            progress(count, total)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=FAVICON_WORKERS, thread_name_prefix="import") as pool:
+        for url in urls:
+            pool.submit(fetch_favicon, url).add_done_callback(step)
+        extract_icons(paths, progress=step)
+    return total
+
 
 class LauncherTab:
-    def __init__(self, parent, type_, data_key, border_color, extract_func, launch_func):
+    def __init__(self, parent, type_, data_key, border_color, extract_func, launch_func, icon_loader=None):
         self.parent = parent
         self.type_ = type_
         self.data_key = data_key
         self.border_color = border_color
         self.extract_icon = extract_func
         self.launch_action = launch_func
+        self.icon_loader = icon_loader
         self.items = []
-        self.icons = []
+        self.cells = {}
+        self.spare = []
         self.rearrange_mode = False
         self.drag_data = {"index": None}
         self.original_order = []
+        self.tooltip = None
+        self.tooltip_job = None
 
         tab_name = "\U0001F4BE Apps" if type_ == "apps" else "\U0001F310 Websites"
 
         self.frame = tk.Frame(parent.notebook, bg=APP_BG)
         parent.notebook.add(self.frame, text=tab_name)
-        self.grid = tk.Frame(self.frame, bg=APP_BG)
-        self.grid.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(self.frame, bg=APP_BG, bd=0, highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scroll)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        self.bind_scroll(self.canvas)
 
     def load(self):
         self.items = self.parent.data.get(self.data_key, [])
@@ -128,6 +2092,7 @@ class LauncherTab:
     def save(self):
         self.parent.data[self.data_key] = self.items
         self.parent.save_config()
+        self.parent.on_items_changed(self)
 
     def add_item(self):
         if self.type_ == "apps":
@@ -141,49 +2106,232 @@ class LauncherTab:
         self.save()
         self.refresh()
 
-    def refresh(self):
-        for widget in self.grid.winfo_children():
-            widget.destroy()
-        self.icons.clear()
-
-        for i, item in enumerate(self.items):
-            name = item.get("custom_name")
-            if not name:
-                key = "path" if self.type_ == "apps" else "url"
-                name = os.path.splitext(os.path.basename(item[key]))[0] if self.type_ == "apps" else item[key].split("//")[-1].split("/")[0]
-
-            icon_img = self.extract_icon(item.get("path") if self.type_ == "apps" else item.get("url"))
-
-            if self.type_ == "apps" and item.get("launch_with_ed"):
-                path = item.get("path", "").lower()
-                if not path.endswith("edlaunch.exe"):
-                    icon_img = overlay_launch_icon(icon_img)
-
-            icon = ImageTk.PhotoImage(icon_img)
-            self.icons.append(icon)
-
-            border = HIGHLIGHT_BORDER if self.rearrange_mode else self.border_color
-            container = tk.Frame(self.grid, bg=border, padx=2, pady=2)
-            cols = self.parent.grid_columns.get()
-            container.grid(row=i // cols, column=i % cols, padx=10, pady=10)
-
-            label = tk.Label(container, image=icon, text=name, compound='top', bg=APP_BG, fg="white", bd=0)
-            label._item_index = i
-            label.pack()
-
-            if not self.rearrange_mode:
-                label.bind("<Button-1>", lambda e, key=item.get("path") or item.get("url"): self.launch_action(key))
-                label.bind("<Button-3>", lambda e, idx=i: self.show_context_menu(e, idx))
+    def item_name(self, item):
+        return entry_name(item, self.type_)
+
+    def item_key(self, item):
+        return item.get("path") if self.type_ == "apps" else item.get("url")
+
+    def shows_overlay(self, item):
+        return (self.type_ == "apps" and item.get("launch_with_ed")
+                and not item.get("path", "").lower().endswith("edlaunch.exe"))
+
+    def photo_key(self, item):
+        source = self.item_key(item)
+        icon_key = IconCache.key_for_path(source) if self.type_ == "apps" else IconCache.key_for_url(source)
+        return (icon_key, "launch" if self.shows_overlay(item) else "normal")
+
+    def item_photo(self, item, key):
+        pool = self.parent.photo_pool
+        source = self.item_key(item)
+        if self.icon_loader and key not in pool.images:
+            icon_img = self.icon_loader.request(source, lambda image: self.fill_icon(item, key, image))
+            if icon_img is None:
+                return pool.get(("placeholder",), placeholder_icon)
+            return pool.get(key, lambda: self.decorate_image(item, icon_img))
+        return pool.get(key, lambda: self.decorate_image(item, self.extract_icon(source)))
+
+    def decorate_image(self, item, icon_img):
+        if self.shows_overlay(item):
+            icon_img = overlay_launch_icon(icon_img)
+        return icon_img
+
+    def fill_icon(self, item, key, image):
+        cell = self.cells.get(id(item))
+        if cell is None or cell["item"] is not item or cell["image_sig"] != key:
+            return
+        cell["photo"] = self.parent.photo_pool.get(key, lambda: self.decorate_image(item, image))
+        cell["label"].configure(image=cell["photo"])
+
+    def create_cell(self):
+        container = tk.Frame(self.canvas, padx=2, pady=2)
+        label = tk.Label(container, compound='top', bg=APP_BG, fg="white", bd=0, wraplength=CELL_SIZE[0] - 8)
+        label.pack(fill=tk.BOTH, expand=True)
+        window = self.canvas.create_window(0, 0, window=container, anchor="nw", width=CELL_SIZE[0], height=CELL_SIZE[1])
+        badge = tk.Label(container, text="\u25CF", fg=RUNNING_COLOR, bg=APP_BG, bd=0, font=("Segoe UI", 8))
+        cell = {"item": None, "container": container, "label": label, "badge": badge, "window": window, "photo": None,
+                "image_sig": None, "name": None, "border": None, "pos": None, "running": False}
+
+        label.bind("<Enter>", lambda e: self.on_hover(label))
+        label.bind("<Leave>", self.hide_tooltip)
+        label.bind("<ButtonPress-1>", lambda e: self.on_click(e, label._item_index))
+        label.bind("<B1-Motion>", self.on_drag_motion)
+        label.bind("<Button-3>", lambda e: self.on_right_click(e, label._item_index))
+        self.bind_scroll(label)
+        return cell
+
+    def acquire_cell(self, item):
+        cell = self.spare.pop() if self.spare else self.create_cell()
+        cell["item"] = item
+        return cell
+
+    def release_cell(self, cell):
+        # Parked outside the scroll region, where the canvas unmaps it. The
+        # image is forgotten too, so a cell reused for the same item while
+        # its icon was still loading asks for the icon again.
+        cell["item"] = None
+        cell["pos"] = None
+        cell["image_sig"] = None
+        cell["photo"] = None
+        self.canvas.coords(cell["window"], -CELL_SIZE[0] * 2, -CELL_SIZE[1] * 2)
+        self.spare.append(cell)
+
+    def update_cell(self, cell, item, i, cols, border):
+        cell["label"]._item_index = i
+
+        image_sig = self.photo_key(item)
+        if cell["image_sig"] != image_sig:
+            cell["image_sig"] = image_sig
+            cell["photo"] = self.item_photo(item, image_sig)
+            cell["label"].configure(image=cell["photo"])
+
+        name = self.item_name(item)
+        if cell["name"] != name:
+            cell["label"].configure(text=name)
+            cell["name"] = name
+
+        if cell["border"] != border:
+            cell["container"].configure(bg=border)
+            cell["border"] = border
+
+        running = self.is_running(item)
+        if cell["running"] != running:
+            if running:
+                cell["badge"].place(x=2, y=2, anchor="nw")
             else:
-                label.bind("<ButtonPress-1>", lambda e, idx=i: self.on_drag_start(e, idx))
-                label.bind("<B1-Motion>", self.on_drag_motion)
+                cell["badge"].place_forget()
+            cell["running"] = running
+
+        pos = (i // cols, i % cols)
+        if cell["pos"] != pos:
+            pitch_x, pitch_y = self.pitch()
+            self.canvas.coords(cell["window"], pos[1] * pitch_x + CELL_PAD, pos[0] * pitch_y + CELL_PAD)
+            cell["pos"] = pos
+
+    def is_running(self, item):
+        sampler = self.parent.sampler
+        return self.type_ == "apps" and sampler is not None and bool(item.get("path")) and sampler.is_running(item["path"])
+
+    def on_hover(self, label):
+        self.hide_tooltip()
+        if not self.rearrange_mode:
+            self.tooltip_job = self.canvas.after(TOOLTIP_DELAY_MS, lambda: self.show_tooltip(label))
+
+    def show_tooltip(self, label):
+        # Re-reads the sampler while shown, so the numbers stay live.
+        self.tooltip_job = None
+        index = getattr(label, "_item_index", None)
+        if index is None or index >= len(self.items) or not self.is_running(self.items[index]):
+            self.hide_tooltip()
+            return
+        item = self.items[index]
+        usage = self.parent.sampler.usage(item["path"])
+        if usage is None:
+            self.hide_tooltip()
+            return
+        if self.tooltip is None:
+            self.tooltip = tk.Toplevel(self.canvas)
+            self.tooltip.overrideredirect(True)
+            self.tooltip.attributes("-topmost", True)
+            tk.Label(self.tooltip, bg=APP_BG, fg="white", bd=1, relief=tk.SOLID, justify=tk.LEFT, padx=4, pady=2).pack()
+        self.tooltip.winfo_children()[0].configure(text=f"{self.item_name(item)}\n{format_usage(usage)}")
+        self.tooltip.geometry(f"+{label.winfo_rootx() + CELL_SIZE[0]}+{label.winfo_rooty()}")
+        self.tooltip.deiconify()
+        self.tooltip_job = self.canvas.after(int(SAMPLE_MIN_INTERVAL * 1000), lambda: self.show_tooltip(label))
+
+    def hide_tooltip(self, event=None):
+        if self.tooltip_job is not None:
+            self.canvas.after_cancel(self.tooltip_job)
+            self.tooltip_job = None
+        if self.tooltip is not None:
+            self.tooltip.withdraw()
+
+    def pitch(self):
+        return CELL_SIZE[0] + CELL_PAD * 2, CELL_SIZE[1] + CELL_PAD * 2
+
+    def visible_rows(self):
+        pitch_y = self.pitch()[1]
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), pitch_y)
+        first = max(0, int(top // pitch_y) - OVERSCAN_ROWS)
+        last = int((top + height) // pitch_y) + OVERSCAN_ROWS
+        return first, last
+
+    # Only rows in or near the viewport have widgets. Cells are kept per entry
+    # while visible and recycled through self.spare as entries scroll out, and
+    # are only touched where something changed.
+    @traced("tab.refresh")
+    def refresh(self):
+        cols = max(1, self.parent.grid_columns.get())
+        pitch_x, pitch_y = self.pitch()
+        rows = (len(self.items) + cols - 1) // cols
+        self.canvas.configure(scrollregion=(0, 0, cols * pitch_x, rows * pitch_y), yscrollincrement=pitch_y)
+        border = HIGHLIGHT_BORDER if self.rearrange_mode else self.border_color
+
+        first, last = self.visible_rows()
+        visible = {}
+        for i in range(first * cols, min(len(self.items), (last + 1) * cols)):
+            visible[id(self.items[i])] = i
+
+        for key in list(self.cells):
+            cell = self.cells[key]
+            i = visible.get(key)
+            if i is None or self.items[i] is not cell["item"]:
+                self.release_cell(self.cells.pop(key))
+
+        for key, i in visible.items():
+            item = self.items[i]
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = self.acquire_cell(item)
+            self.update_cell(cell, item, i, cols, border)
+
+        while len(self.spare) > len(self.cells):
+            cell = self.spare.pop()
+            self.canvas.delete(cell["window"])
+            cell["container"].destroy()
+
+        if self.icon_loader:
+            self.icon_loader.cancel({self.item_key(self.items[i]) for i in visible.values()})
+
+    def bind_scroll(self, widget):
+        widget.bind("<MouseWheel>", self.on_mousewheel)
+        widget.bind("<Button-4>", self.on_mousewheel)
+        widget.bind("<Button-5>", self.on_mousewheel)
+
+    def on_scroll(self, *args):
+        self.canvas.yview(*args)
+        self.refresh()
+
+    def on_mousewheel(self, event):
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self.canvas.yview_scroll(step, "units")
+        self.refresh()
+
+    def on_click(self, event, idx):
+        self.hide_tooltip()
+        if self.rearrange_mode:
+            self.on_drag_start(event, idx)
+        else:
+            self.parent.record_usage(self.items[idx])
+            self.launch_action(self.item_key(self.items[idx]))
 
+    def on_right_click(self, event, idx):
+        self.hide_tooltip()
+        if not self.rearrange_mode:
+            self.show_context_menu(event, idx)
 
     def on_drag_start(self, event, idx):
         self.drag_data["index"] = idx
         self.drag_data["widget"] = event.widget
 
     def on_drag_motion(self, event):
+        if not self.rearrange_mode or self.drag_data["index"] is None:
+            return
+        y = event.y_root - self.canvas.winfo_rooty()
+        if y < CELL_PAD * 2 or y > self.canvas.winfo_height() - CELL_PAD * 2:
+            self.canvas.yview_scroll(-1 if y < CELL_PAD * 2 else 1, "units")
+            self.refresh()
         widget = event.widget.winfo_containing(event.x_root, event.y_root)
         if widget and hasattr(widget, "_item_index"):
             target_idx = widget._item_index
@@ -209,6 +2357,11 @@ class LauncherTab:
                                     variable=var, command=toggle)
         menu.add_command(label="Rename", command=lambda: self.rename_item(index))
         menu.add_command(label="Remove", command=lambda: self.remove_item(index))
+        if self.is_running(self.items[index]):
+            item = self.items[index]
+            menu.add_separator()
+            menu.add_command(label="Focus Window", command=lambda: self.parent.focus_app(item))
+            menu.add_command(label="End Process", command=lambda: self.parent.end_app(item))
 
         menu.tk_popup(event.x_root, event.y_root)
 
@@ -243,7 +2396,7 @@ class LauncherTab:
 
 
 class AppLauncher:
-    def __init__(self, root):
+    def __init__(self, root, data=None):
         self.root = root
         self.root.title("Elite:Dangerous Launcher")
         self.root.configure(bg=APP_BORDER)  # Set to border color
@@ -251,9 +2404,25 @@ class AppLauncher:
         self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
         self.keep_on_top_var = tk.BooleanVar(value=False)
         self.data = {}
-
+        self.store = ConfigStore(self.root, self.serialize_config)
+        self.store.on_conflict = lambda: self.dispatcher.call(self.reload_config)
+        self.config_watcher = create_file_watcher(CONFIG_FILE)
+        self.reload_pending = False
+        self.photo_pool = PhotoImagePool()
+        self.dispatcher = TkDispatcher(self.root)
+        self.tray_icon = None
+        self.tray_entries = None
+        self.search_index = SearchIndex()
+        self.palette = None
+        self.instance_server = None
+        self.last_auto_launch = []
+        self.trace_path = None
+        self.perf_window = None
+        self.sampler = ProcessSampler(lambda: self.dispatcher.call(self.apps_tab.refresh))
+
+        from PIL import Image
         try:
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(u"elite.dangerous.launcher")
+            get_platform().set_app_id(u"elite.dangerous.launcher")
             self.root.iconbitmap("images/icon.ico")  # Ensure it's a real .ico file
             self.root.iconphoto(True, tk.PhotoImage(file=ICON_PATH))  # Use .png for the UI icon
             self.tray_image = Image.open(ICON_PATH).resize((64, 64))
@@ -286,6 +2455,15 @@ class AppLauncher:
         self.save_button.grid(row=2, column=0, sticky="ew")
         self.save_button.grid_remove()  # Hidden by default
 
+        # Update notice, shown without blocking when a newer release exists
+        self.update_bar = tk.Frame(self.inner_frame, bg=HIGHLIGHT_BORDER)
+        self.update_label = tk.Label(self.update_bar, bg=HIGHLIGHT_BORDER, fg="black")
+        self.update_label.pack(side=tk.LEFT, padx=5)
+        tk.Button(self.update_bar, text="\u2715", command=self.update_bar.grid_remove, bg=HIGHLIGHT_BORDER,
+                  bd=0).pack(side=tk.RIGHT, padx=5)
+        tk.Button(self.update_bar, text="Download", command=lambda: self.launch_website(RELEASES_URL),
+                  bg=APP_BORDER, fg="white").pack(side=tk.RIGHT)
+
         # Tab Colors
         style = ttk.Style()
         style.theme_use("default")
@@ -296,16 +2474,25 @@ class AppLauncher:
         # Tabs
         self.grid_columns = tk.IntVar(value=5)
         self.apps_tab = LauncherTab(self, "apps", "apps", APP_BORDER, extract_icon, self.launch_app)
-        self.web_tab = LauncherTab(self, "websites", "websites", WEB_BORDER, fetch_favicon, self.launch_website)
+        self.favicon_loader = IconLoader(self.root, fetch_favicon, cached_favicon)
+        self.web_tab = LauncherTab(self, "websites", "websites", WEB_BORDER, fetch_favicon, self.launch_website,
+                                   icon_loader=self.favicon_loader)
 
         # Menu
         self.menu_bar = Menu(self.root)
         options_menu = Menu(self.menu_bar, tearoff=0)
+        options_menu.add_command(label="Quick Launch", accelerator="Ctrl+K", command=self.show_palette)
         options_menu.add_checkbutton(label="Keep on Top", variable=self.keep_on_top_var, command=self.toggle_on_top)
         options_menu.add_command(label="Rearrange Apps", command=lambda: self.toggle_rearrange(self.apps_tab))
         options_menu.add_command(label="Rearrange Websites", command=lambda: self.toggle_rearrange(self.web_tab))
         options_menu.add_command(label="Minimize to Tray", command=self.hide_to_tray)
         options_menu.add_command(label="Set Grid Size", command=self.prompt_grid_size)
+        import_menu = Menu(options_menu, tearoff=0)
+        import_menu.add_command(label="Scan Folder for Apps...", command=lambda: self.import_items("folder"))
+        import_menu.add_command(label="Browser Bookmarks...", command=lambda: self.import_items("bookmarks"))
+        import_menu.add_command(label="Another data.edl...", command=lambda: self.import_items("config"))
+        options_menu.add_cascade(label="Import", menu=import_menu)
+        options_menu.add_command(label="Performance", command=self.show_performance)
         options_menu.add_separator()
         options_menu.add_command(label="Close", command=self.exit_app)
         self.menu_bar.add_cascade(label="Options", menu=options_menu)
@@ -319,10 +2506,17 @@ class AppLauncher:
         self.root.config(menu=self.menu_bar)
 
         # Load config and initialize
-        self.load_config()
+        self.load_config(data)
         self.root.bind("<Escape>", lambda e: self.cancel_rearrange())
-        
-        threading.Thread(target=monitor_edlauncher, args=(self,), daemon=True).start()
+        self.root.bind("<Control-k>", self.show_palette)
+        self.root.bind("<Unmap>", self.on_visibility)
+        self.root.bind("<Map>", self.on_visibility)
+        self.sampler.start()
+
+        self.triggers = TriggerEngine(trigger_rules(self.data), lambda rule, event: threading.Thread(
+            target=run_trigger, args=(self, rule, event), name="trigger", daemon=True).start())
+        threading.Thread(target=monitor_processes, args=(self,), daemon=True).start()
+        threading.Thread(target=watch_config, args=(self, self.config_watcher), name="config-watcher", daemon=True).start()
 
     def prompt_grid_size(self):
         size = simpledialog.askinteger("Grid Size", "Enter number of icons per row (e.g., 3–10):", minvalue=1, maxvalue=10)
@@ -331,12 +2525,52 @@ class AppLauncher:
             self.apps_tab.refresh()
             self.web_tab.refresh()
 
-    def exit_app(self, icon=None, item=None):
-        if hasattr(self, 'tray_icon') and self.tray_icon:
-            self.tray_icon.stop()
-        self.save_config()
-        self.apps_tab.refresh()
-        self.root.quit()
+    def show_performance(self):
+        if self.perf_window and self.perf_window.winfo_exists():
+            self.perf_window.lift()
+            return
+        win = self.perf_window = tk.Toplevel(self.root)
+        win.title("Performance")
+        win.configure(bg=APP_BG)
+        win.geometry("520x360")
+
+        controls = tk.Frame(win, bg=APP_BG)
+        controls.pack(fill=tk.X)
+        enabled = tk.BooleanVar(value=tracer.enabled)
+        tk.Checkbutton(controls, text="Record timings", variable=enabled, command=lambda: setattr(tracer, "enabled", enabled.get()),
+                       bg=APP_BG, fg="white", selectcolor=APP_BG, activebackground=APP_BG).pack(side=tk.LEFT, padx=5)
+        tk.Button(controls, text="Export Trace", command=self.export_trace, bg=APP_BORDER, fg="white").pack(side=tk.RIGHT, padx=5, pady=5)
+        tk.Button(controls, text="Reset", command=tracer.reset, bg=APP_BORDER, fg="white").pack(side=tk.RIGHT, pady=5)
+        sampler_label = tk.Label(win, bg=APP_BG, fg="white", anchor="w")
+        sampler_label.pack(fill=tk.X, padx=5)
+
+        columns = ("count", "total", "mean", "max")
+        tree = ttk.Treeview(win, columns=columns)
+        tree.heading("#0", text="Span")
+        for column, title in zip(columns, ("Calls", "Total ms", "Mean ms", "Max ms")):
+            tree.heading(column, text=title)
+            tree.column(column, width=70, anchor="e")
+        tree.pack(fill=tk.BOTH, expand=True)
+
+        def update():
+            if not win.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for name, count, total, mean, peak in tracer.hot_spots():
+                tree.insert("", "end", text=name, values=(count, f"{total:.1f}", f"{mean:.2f}", f"{peak:.2f}"))
+            sampler = self.sampler
+            sampler_label.configure(text=f"Process sampler: {len(sampler.procs)} processes, every {sampler.interval:.1f} s, "
+                                         f"{sampler.overhead():.2%} of wall time" + ("" if sampler.active.is_set() else " (paused)"))
+            win.after(PERF_PANEL_REFRESH_MS, update)
+        update()
+
+    def export_trace(self):
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("Chrome trace", "*.json")])
+        if path:
+            try:
+                tracer.export(path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to export trace:\n{e}")
 
     def show_help(self):
         help_text = (
@@ -345,13 +2579,16 @@ class AppLauncher:
             "📁  Adding:\n"
             "• Use the 'Add' button to add either apps or websites based on the selected tab.\n\n"
             "🖱️  Launching:\n"
-            "• Click any icon to launch the app or open the website in your browser.\n\n"
+            "• Click any icon to launch the app or open the website in your browser.\n"
+            "• Press Ctrl+K to search all apps and websites by name and launch one.\n\n"
             "🛠️  Managing:\n"
             "• Right-click an icon to Rename or Remove it.\n"
             "• Apps also have an option to 'Launch with Elite Dangerous'.\n"
             "  - This option automatically starts the app when ED is launched.\n"
             "  - A small 🚀 icon appears in the top-right of any app set to auto-launch.\n"
-            "  - You cannot set the ED launcher itself to auto-launch.\n\n"
+            "  - You cannot set the ED launcher itself to auto-launch.\n"
+            "• Running apps show a green dot in the top-left. Hover one to see its CPU and memory use,\n"
+            "  or right-click it to Focus Window or End Process.\n\n"
             "🔃  Rearranging:\n"
             "• Use the 'Options' menu to enter Rearranging Mode.\n"
             "• Drag icons to reorder them.\n"
@@ -359,7 +2596,10 @@ class AppLauncher:
             "⚙️  Options Menu:\n"
             "• Keep on Top – keeps the window above others.\n"
             "• Minimize to Tray – hides the app to the system tray.\n"
+            "  - Right-click the tray icon to launch apps and websites directly.\n"
             "• Set Grid Size – change the number of icons per row.\n"
+            "• Import – add apps from a folder, websites from browser bookmarks, or entries from another data.edl.\n"
+            "• Performance – shows where the launcher spends its time.\n"
             "• Close – exits the launcher.\n\n"
             "💾  The launcher remembers your window position, size, layout, and all entries automatically.\n\n"
             "🆕  Apps marked for auto-launch will launch automatically when 'EDLaunch.exe' is detected running."
@@ -390,53 +2630,198 @@ class AppLauncher:
         self.apps_tab.cancel_rearrange()
         self.web_tab.cancel_rearrange()
         self.save_button.pack_forget()
+        if self.reload_pending:
+            self.reload_config()
 
     def save_rearranged(self):
         self.apps_tab.save_rearranged()
         self.web_tab.save_rearranged()
         self.save_button.grid_remove()
-
+        if self.reload_pending:
+            self.reload_config()
+
+
+    # Bulk import. Reading, scanning and icon warmup run on a worker thread
+    # with a progress window; the entries are added and the config written
+    # once at the end.
+    def import_items(self, source):
+        if source == "folder":
+            path = filedialog.askdirectory(title="Scan Folder for Apps")
+        elif source == "bookmarks":
+            path = filedialog.askopenfilename(title="Import Bookmarks",
+                                              filetypes=[("Bookmarks", "*.html *.htm *.json"), ("All files", "*.*")])
+        else:
+            path = filedialog.askopenfilename(title="Import data.edl", filetypes=[("Launcher data", "*.edl"), ("All files", "*.*")])
+        if not path:
+            return
+
+        win = tk.Toplevel(self.root)
+        win.title("Import")
+        win.transient(self.root)
+        win.configure(bg=APP_BG, padx=10, pady=10)
+        status = tk.Label(win, text=f"Reading {os.path.basename(path) or path}...", bg=APP_BG, fg="white", anchor="w", width=45)
+        status.pack(fill=tk.X)
+        bar = ttk.Progressbar(win, length=300, mode="determinate")
+        bar.pack(fill=tk.X, pady=(5, 0))
+        existing = {"apps": list(self.apps_tab.items), "websites": list(self.web_tab.items)}
+
+        def progress(done, total):
+            if win.winfo_exists():
+                bar.configure(maximum=total, value=done)
+                status.configure(text=f"Loading icons... {done}/{total}")
+
+        def work():
+            try:
+                if source == "folder":
+                    apps, websites = scan_apps(path), []
+                elif source == "bookmarks":
+                    apps, websites = [], read_bookmarks(path)
+                else:
+                    apps, websites = read_edl(path)
+                found = len(apps) + len(websites)
+                apps = merge_entries(existing["apps"], apps, "apps")
+                websites = merge_entries(existing["websites"], websites, "websites")
+            except Exception as e:
+                # Anything unexpected still closes the progress window.
+                self.dispatcher.call(self.finish_import, win, None, f"Failed to read {path}:\n{e}")
+                return
+            try:
+                warm_icons([item["path"] for item in apps], [item["url"] for item in websites],
+                           lambda done, total: self.dispatcher.call(progress, done, total))
+            except Exception as e:
+                print(f"Icon warmup failed: {e}")
+            self.dispatcher.call(self.finish_import, win, (apps, websites, found))
+
+        threading.Thread(target=work, name="import", daemon=True).start()
+
+    def finish_import(self, win, result, error=None):
+        if win.winfo_exists():
+            win.destroy()
+        if error:
+            messagebox.showerror("Import", error)
+            return
+        apps, websites, found = result
+        added = 0
+        for tab, items in ((self.apps_tab, apps), (self.web_tab, websites)):
+            # Re-checked here in case entries were added while importing.
+            items = merge_entries(tab.items, items, tab.type_)
+            if items:
+                tab.items.extend(items)
+                self.data[tab.data_key] = tab.items
+                tab.refresh()
+                self.on_items_changed(tab)
+                added += len(items)
+        if added:
+            self.save_config()
+            self.store.flush()
+        messagebox.showinfo("Import", f"Imported {added} of {found} entries; {found - added} were already in the launcher.")
 
     def toggle_on_top(self):
         self.root.attributes('-topmost', self.keep_on_top_var.get())
 
+    def record_usage(self, item):
+        item["launch_count"] = item.get("launch_count", 0) + 1
+        item["last_launched"] = int(time.time())
+        self.search_index.touch()
+        self.save_config()
+
+    def launch_entry(self, item, type_):
+        self.record_usage(item)
+        if type_ == "apps":
+            self.launch_app(item["path"])
+        else:
+            self.launch_website(item["url"])
+
+    def show_palette(self, event=None):
+        if self.palette and self.palette.winfo_exists():
+            self.palette.lift()
+            self.palette.focus_force()
+            return "break"
+        win = self.palette = tk.Toplevel(self.root)
+        win.title("Quick Launch")
+        win.transient(self.root)
+        win.configure(bg=APP_BORDER, padx=3, pady=3)
+
+        query = tk.StringVar()
+        entry = tk.Entry(win, textvariable=query, bg=APP_BG, fg="white", insertbackground="white", font=("Segoe UI", 12), bd=0)
+        entry.pack(fill=tk.X, ipady=4)
+        listbox = tk.Listbox(win, bg=APP_BG, fg="white", selectbackground=APP_BORDER, height=PALETTE_RESULTS,
+                             width=40, activestyle="none", bd=0, highlightthickness=0)
+        listbox.pack(fill=tk.BOTH, expand=True)
+        results = []
+
+        def update(*_):
+            results[:] = self.search_index.search(query.get())
+            listbox.delete(0, tk.END)
+            for item, type_ in results:
+                symbol = "\U0001F4BE" if type_ == "apps" else "\U0001F310"
+                listbox.insert(tk.END, f"{symbol}  {entry_name(item, type_)}")
+            if results:
+                listbox.selection_set(0)
+
+        def move(step):
+            if results:
+                current = listbox.curselection()
+                index = min(max((current[0] if current else 0) + step, 0), len(results) - 1)
+                listbox.selection_clear(0, tk.END)
+                listbox.selection_set(index)
+                listbox.see(index)
+            return "break"
+
+        def launch(event=None):
+            current = listbox.curselection()
+            if results:
+                item, type_ = results[current[0] if current else 0]
+                win.destroy()
+                self.launch_entry(item, type_)
+
+        query.trace_add("write", update)
+        entry.bind("<Return>", launch)
+        entry.bind("<Down>", lambda e: move(1))
+        entry.bind("<Up>", lambda e: move(-1))
+        win.bind("<Escape>", lambda e: win.destroy())
+        listbox.bind("<Double-Button-1>", launch)
+        update()
+        entry.focus_force()
+        return "break"
+
+    @traced("launch_app")
     def launch_app(self, path):
         try:
-            if path.lower().endswith(".bat"):
-                subprocess.Popen(["cmd.exe", "/c", path])
-            else:
-                subprocess.Popen(path)
+            self.sampler.track(path, spawn_app(path).pid)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to launch app:\n{e}")
 
+    @traced("launch_website")
     def launch_website(self, url):
+        import webbrowser
         try:
             webbrowser.open(url)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open website:\n{e}")
 
-    def load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "r") as f:
-                self.data = json.load(f)
-                grid_size = self.data.get("grid_columns", 5)
-                self.grid_columns = tk.IntVar(value=grid_size)
-
-                self.apps_tab.load()
-                self.web_tab.load()
-
-                # ✅ Apply geometry BEFORE showing window
-                pos = self.data.get("window_position")
-                if pos:
-                    x = pos.get("x", 100)
-                    y = pos.get("y", 100)
-                    w = pos.get("width", 500)
-                    h = pos.get("height", 400)
-                    self.root.geometry(f"{w}x{h}+{x}+{y}")
-        else:
-            self.apps_tab.load()
-            self.web_tab.load()
-
+    @traced("load_config")
+    def load_config(self, data=None):
+        self.data = data if data is not None else read_config()
+        self.grid_columns = tk.IntVar(value=self.data.get("grid_columns", 5))
+
+        self.apps_tab.load()
+        self.web_tab.load()
+        self.search_index.sync("apps", self.apps_tab.items)
+        self.search_index.sync("websites", self.web_tab.items)
+        self.sampler.watch(item.get("path") for item in self.apps_tab.items)
+        self.store.mark_synced(self.serialize_config(), file_signature(CONFIG_FILE))
+
+        # ✅ Apply geometry BEFORE showing window
+        pos = self.data.get("window_position")
+        if pos:
+            x = pos.get("x", 100)
+            y = pos.get("y", 100)
+            w = pos.get("width", 500)
+            h = pos.get("height", 400)
+            self.root.geometry(f"{w}x{h}+{x}+{y}")
+
+    @traced("save_config")
     def save_config(self):
         self.data["grid_columns"] = self.grid_columns.get()
         x = self.root.winfo_x()
@@ -444,38 +2829,386 @@ class AppLauncher:
         w = self.root.winfo_width()
         h = self.root.winfo_height()
         self.data["window_position"] = {"x": x, "y": y, "width": w, "height": h}
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.data, f, indent=4)
+        self.store.mark_dirty()
+
+    @traced("config.serialize")
+    def serialize_config(self):
+        return json.dumps(self.data, indent=4)
+
+    # Applies an external edit of data.edl. Our own writes are recognised by
+    # their signature; otherwise the file is merged with the in-memory config
+    # and only the tabs, columns or geometry that changed are updated.
+    @traced("config.reload")
+    def reload_config(self, force=False):
+        signature = file_signature(CONFIG_FILE)
+        if signature is None or signature == self.store.synced_sig:
+            return
+        if not force and (self.apps_tab.rearrange_mode or self.web_tab.rearrange_mode):
+            self.reload_pending = True
+            return
+        self.reload_pending = False
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                text = f.read()
+            theirs = json.loads(text)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring change to {CONFIG_FILE}: {e}")
+            return
+        base = json.loads(self.store.synced) if self.store.synced else {}
+        self.store.discard_pending()
+        self.store.mark_synced(text, signature)
+        if theirs == base:
+            return
+
+        for tab in (self.apps_tab, self.web_tab):
+            items, changed = merge_entry_lists(base.get(tab.data_key, []), tab.items, theirs.get(tab.data_key, []), tab.type_)
+            if changed:
+                tab.items[:] = items
+                self.data[tab.data_key] = tab.items
+                tab.refresh()
+                self.on_items_changed(tab)
+
+        columns = merge_value(base.get("grid_columns", 5), self.grid_columns.get(), theirs.get("grid_columns", 5))
+        if columns != self.grid_columns.get():
+            self.grid_columns.set(columns)
+            self.data["grid_columns"] = columns
+            self.apps_tab.refresh()
+            self.web_tab.refresh()
 
+        pos = theirs.get("window_position")
+        if pos and pos != base.get("window_position"):
+            self.data["window_position"] = pos
+            self.root.geometry(f"{pos.get('width', 500)}x{pos.get('height', 400)}+{pos.get('x', 100)}+{pos.get('y', 100)}")
+
+        for key in set(base) | set(theirs):
+            if key not in ("apps", "websites", "grid_columns", "window_position"):
+                value = merge_value(base.get(key), self.data.get(key), theirs.get(key))
+                if value is None:
+                    self.data.pop(key, None)
+                else:
+                    self.data[key] = value
+        self.triggers.set_rules(trigger_rules(self.data))
+
+        if self.serialize_config() != text:
+            self.store.mark_dirty()
+
+    # The tray icon is created on first use and kept for the rest of the
+    # session; hiding and showing only withdraw and restore the window.
     def hide_to_tray(self):
         self.save_config()
-        self.apps_tab.refresh()
+        if self.tray_icon is None:
+            self.tray_icon = get_platform().create_tray("launcher", self.tray_image, "Elite:Dangerous Launcher", self.tray_menu)
+            if self.tray_icon is None:
+                self.root.iconify()
+                return
+            threading.Thread(target=self.tray_icon.run, name="tray", daemon=True).start()
         self.root.withdraw()
-        menu = (TrayMenuItem("Show", self.show_window), TrayMenuItem("Exit", self.exit_app))
-        self.tray_icon = pystray.Icon("launcher", self.tray_image, "Elite:Dangerous Launcher", menu)
-        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        self.sampler.pause()
+
+    # Sampling only matters while the tiles can be seen.
+    def on_visibility(self, event):
+        if event.widget is not self.root:
+            return
+        if event.type == tk.EventType.Unmap:
+            self.sampler.pause()
+        else:
+            self.sampler.resume()
 
-    def show_window(self, icon=None, item=None):
+    def focus_app(self, item):
+        usage = self.sampler.usage(item["path"])
+        try:
+            if usage and any(get_platform().focus_process(pid) for pid in usage["pids"]):
+                return
+        except Exception as e:
+            print(f"Failed to focus window: {e}")
+        messagebox.showinfo("Focus Window", f"No window found for {entry_name(item, 'apps')}.")
+
+    def end_app(self, item):
+        if messagebox.askyesno("End Process", f"End {entry_name(item, 'apps')}? Unsaved work in it will be lost."):
+            self.sampler.terminate(item["path"])
+
+    def tray_action(self, func, *args):
+        # pystray calls actions from its own thread with (icon, item).
+        return lambda icon, item: self.dispatcher.call(func, *args)
+
+    def tray_menu(self):
+        if self.tray_entries is None:
+            apps = [(entry_name(item, "apps"), self.tray_action(self.launch_entry, item, "apps"))
+                    for item in self.apps_tab.items]
+            sites = [(entry_name(item, "websites"), self.tray_action(self.launch_entry, item, "websites"))
+                     for item in self.web_tab.items]
+            self.tray_entries = [("Show", self.tray_action(self.bring_to_front), True), None]
+            if apps:
+                self.tray_entries.append(("Apps", apps))
+            if sites:
+                self.tray_entries.append(("Websites", sites))
+            self.tray_entries += [None, ("Exit", self.tray_action(self.exit_app))]
+        return self.tray_entries
+
+    def on_items_changed(self, tab):
+        self.search_index.sync(tab.type_, tab.items)
+        if tab.type_ == "apps":
+            self.sampler.watch(item.get("path") for item in tab.items)
+        self.tray_entries = None
+        if self.tray_icon is not None:
+            self.tray_icon.update_menu()
+
+    def handle_instance_command(self, command):
+        # Called on the instance server thread; UI work is dispatched to Tk.
+        action = command.get("action")
+        if action == "show":
+            self.dispatcher.call(self.bring_to_front)
+            return {"ok": True}
+        if action in ("launch", "open-site"):
+            type_ = "apps" if action == "launch" else "websites"
+            item = resolve_entry(list(self.data.get(type_, [])), command.get("name", ""), type_)
+            if item is None:
+                return {"ok": False, "error": f"No entry named '{command.get('name')}' in {CONFIG_FILE}"}
+            self.dispatcher.call(self.launch_entry, item, type_)
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command: {action}"}
+
+    def show_update_notice(self, latest_version):
+        if is_newer_version(latest_version):
+            self.update_label.configure(text=f"Version {latest_version} is available.")
+            self.update_bar.grid(row=3, column=0, sticky="ew")
+
+    def schedule_update_check(self):
+        self.root.after(UPDATE_INTERVAL * 1000, self.run_update_check)
+
+    def run_update_check(self):
+        def check():
+            try:
+                self.dispatcher.call(self.show_update_notice, fetch_latest_version())
+            except Exception as e:
+                print(f"Update check failed: {e}")
+        threading.Thread(target=check, name="update-check", daemon=True).start()
+        self.schedule_update_check()
+
+    def bring_to_front(self):
+        self.show_window()
+        self.root.lift()
+        self.root.focus_force()
+
+    def show_window(self):
         self.root.deiconify()
-        if self.tray_icon:
-            self.tray_icon.stop()
+        self.sampler.resume()
 
-    def exit_app(self, icon=None, item=None):
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+    def exit_app(self):
+        if self.tray_icon:
             self.tray_icon.stop()
-        self.save_config()
-        self.apps_tab.refresh()
+        self.favicon_loader.shutdown()
+        self.sampler.stop()
+        self.config_watcher.stop()
+        if self.instance_server:
+            self.instance_server.close()
+        # Any external edit is merged here, even mid-rearrange, since there is
+        # no later chance; if that keeps failing our copy is written.
+        for _ in range(3):
+            self.reload_config(force=True)
+            self.save_config()
+            if self.store.flush():
+                break
+        else:
+            print(f"Could not merge changes to {CONFIG_FILE} while exiting; saving the launcher's copy")
+            self.save_config()
+            self.store.flush(force=True)
+        if self.trace_path:
+            try:
+                tracer.export(self.trace_path)
+            except OSError as e:
+                print(f"Failed to export trace: {e}")
         self.root.quit()
 
-    
-import ctypes
-from ctypes import windll
 
-def make_window_rounded(hwnd, width, height, radius=30):
-    region = windll.gdi32.CreateRoundRectRgn(
-        0, 0, width, height, radius, radius
-    )
-    windll.user32.SetWindowRgn(hwnd, region, True)
+
+# Startup runs as timed stages. Background stages report back through a queue
+# polled from Tk; the splash closes once every required stage has finished and
+# the minimum display time has passed, instead of after a fixed delay.
+class StartupPipeline:
+    def __init__(self, root=None, min_splash=SPLASH_MIN_SECONDS):
+        self.root = root
+        self.min_splash = min_splash
+        self.start = time.perf_counter()
+        self.timings = {}
+        self.results = {}
+        self.required = set()
+        self.callbacks = {}
+        self.ready_callback = None
+        self.done = queue.Queue()
+        self.polling = False
+
+    def stage(self, name, func, *args):
+        started = time.perf_counter()
+        try:
+            with tracer.span(f"startup.{name}"):
+                return func(*args)
+        finally:
+            self.timings[name] = time.perf_counter() - started
+
+    def run_background(self, name, func, *args, required=True):
+        if required:
+            self.required.add(name)
+
+        def worker():
+            started = time.perf_counter()
+            try:
+                with tracer.span(f"startup.{name}"):
+                    result, error = func(*args), None
+            except Exception as e:
+                result, error = None, e
+            self.timings[name] = time.perf_counter() - started
+            self.done.put((name, result, error))
+
+        threading.Thread(target=worker, name=f"startup-{name}", daemon=True).start()
+
+    def on_result(self, name, callback):
+        if name in self.results:
+            callback(self.results[name])
+        else:
+            self.callbacks[name] = callback
+            self._schedule()
+
+    def when_ready(self, callback):
+        self.ready_callback = callback
+        self._schedule()
+
+    def mark_interactive(self):
+        self.timings["time_to_interactive"] = time.perf_counter() - self.start
+
+    def _schedule(self):
+        if not self.polling:
+            self.polling = True
+            self.root.after(STARTUP_POLL_MS, self._poll)
+
+    def _poll(self):
+        self.polling = False
+        while True:
+            try:
+                name, result, error = self.done.get_nowait()
+            except queue.Empty:
+                break
+            if error is not None:
+                print(f"Startup stage '{name}' failed: {error}")
+            self.results[name] = result
+            self.required.discard(name)
+            callback = self.callbacks.pop(name, None)
+            if callback:
+                callback(result)
+
+        if self.ready_callback and not self.required and time.perf_counter() - self.start >= self.min_splash:
+            callback, self.ready_callback = self.ready_callback, None
+            callback()
+
+        if self.ready_callback or self.callbacks:
+            self._schedule()
+
+# Runs callables on the Tk thread on behalf of other threads.
+class TkDispatcher:
+    def __init__(self, root):
+        self.root = root
+        self.calls = queue.Queue()
+        self.root.after(DISPATCH_POLL_MS, self._poll)
+
+    def call(self, func, *args):
+        self.calls.put((func, args))
+
+    def _poll(self):
+        while True:
+            try:
+                func, args = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"UI call failed: {e}")
+        self.root.after(DISPATCH_POLL_MS, self._poll)
+
+
+# A second invocation hands its command to the running instance over a named
+# pipe (Windows) or Unix socket. Messages are JSON, one request per connection.
+def send_instance_command(command):
+    from multiprocessing.connection import Client
+    address, family = get_platform().ipc_address()
+    try:
+        conn = Client(address, family=family)
+    except OSError:
+        return None
+    with conn:
+        conn.send_bytes(json.dumps(command).encode("utf-8"))
+        if not conn.poll(IPC_TIMEOUT):
+            return {"ok": False, "error": "The running launcher did not respond."}
+        return json.loads(conn.recv_bytes().decode("utf-8"))
+
+
+class InstanceServer:
+    def __init__(self, app):
+        self.app = app
+        address, family = get_platform().ipc_address()
+        if family == "AF_UNIX" and os.path.exists(address):
+            os.remove(address)  # stale socket, we hold the instance lock
+        from multiprocessing.connection import Listener
+        self.listener = Listener(address, family=family)
+        threading.Thread(target=self._serve, name="instance-server", daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                return
+            with conn:
+                # One connection at a time, so a client that never sends
+                # can't hold up the next hand-off.
+                if not conn.poll(IPC_TIMEOUT):
+                    continue
+                try:
+                    command = json.loads(conn.recv_bytes().decode("utf-8"))
+                    reply = self.app.handle_instance_command(command)
+                except Exception as e:
+                    reply = {"ok": False, "error": str(e)}
+                try:
+                    conn.send_bytes(json.dumps(reply).encode("utf-8"))
+                except OSError:
+                    pass
+
+    def close(self):
+        self.listener.close()
+
+
+def parse_args(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Elite:Dangerous Launcher")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--launch", metavar="NAME", help="launch an app from data.edl and exit")
+    group.add_argument("--open-site", metavar="NAME", help="open a website from data.edl and exit")
+    parser.add_argument("--startup-timings", action="store_true", help="print startup stage durations")
+    parser.add_argument("--trace", metavar="FILE", help="record timings and write a Chrome trace to FILE on exit")
+    return parser.parse_args(argv)
+
+def cli_command(args):
+    if args.launch:
+        return {"action": "launch", "name": args.launch}
+    if args.open_site:
+        return {"action": "open-site", "name": args.open_site}
+    return {"action": "show"}
+
+def run_cli_command(command):
+    data = read_config()
+    if command["action"] == "launch":
+        item = resolve_entry(data.get("apps", []), command["name"], "apps")
+        if item:
+            spawn_app(item["path"])
+    else:
+        item = resolve_entry(data.get("websites", []), command["name"], "websites")
+        if item:
+            import webbrowser
+            webbrowser.open(item["url"])
+    if not item:
+        print(f"No entry named '{command['name']}' in {CONFIG_FILE}", file=sys.stderr)
+        return 1
+    return 0
 
 def show_splash(app_data):
     splash = tk.Toplevel()
@@ -492,9 +3225,9 @@ def show_splash(app_data):
     splash.geometry(f"500x500+{x}+{y}")
 
     splash.update_idletasks()
-    hwnd = ctypes.windll.user32.GetParent(splash.winfo_id())
-    make_window_rounded(hwnd, 500, 500, radius=30)
+    get_platform().make_window_rounded(splash, 500, 500, radius=30)
 
+    from PIL import Image, ImageTk
     try:
         img = Image.open(ICON_PATH).convert("RGBA").resize((300, 300))
 
@@ -527,21 +3260,47 @@ def show_splash(app_data):
 
 
 if __name__ == "__main__":
-    # Load config early to access slogans for splash
-    data = {}
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r") as f:
-            data = json.load(f)
-
+    args = parse_args()
+    command = cli_command(args)
+
+    reply = send_instance_command(command)
+    if reply is not None:
+        if not reply.get("ok"):
+            print(reply.get("error"), file=sys.stderr)
+        sys.exit(0 if reply.get("ok") else 1)
+    if command["action"] != "show":
+        sys.exit(run_cli_command(command))
+
+    instance_lock = get_platform().acquire_instance_lock()
+    if instance_lock is None:
+        print("Another launcher instance is already starting.", file=sys.stderr)
+        sys.exit(1)
+
+    tracer.enabled = bool(args.trace)
     root = tk.Tk()
-    splash = show_splash(data)
+    pipeline = StartupPipeline(root)
+
+    # Load config early to access slogans for splash
+    data = pipeline.stage("config", read_config)
+    splash = pipeline.stage("splash", show_splash, data)
     root.withdraw()
+    pipeline.run_background("icon_warmup", warm_app_icons, data)
+    pipeline.run_background("update_check", fetch_latest_version, required=False)
 
     def start_app():
+        app = pipeline.stage("ui", AppLauncher, root, data)
+        app.trace_path = args.trace
         splash.destroy()
-        AppLauncher(root)
         root.deiconify()
-        check_for_updates()
+        pipeline.mark_interactive()
+        if args.startup_timings:
+            print(json.dumps(pipeline.timings, indent=4))
+        pipeline.on_result("update_check", app.show_update_notice)
+        app.schedule_update_check()
+        try:
+            app.instance_server = InstanceServer(app)
+        except OSError as e:
+            print(f"Single-instance channel unavailable: {e}")
 
-    root.after(5000, start_app) #5 seconds before loading into app
-    root.mainloop()
\ No newline at end of file
+    pipeline.when_ready(start_app)
+    root.mainloop()